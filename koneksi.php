@@ -4,8 +4,42 @@
     $password = '';                  
     $db       = 'quiz_pengupil';
 
-    $con = mysqli_connect($host, $user, $password, $db);
-    if (!$con) { 
-        die("Connection failed: " . mysqli_connect_error());    
+    // DB_BACKEND=sqlite: use the SQLite stand-in of the test suite instead of MySQL
+    if (getenv('DB_BACKEND') === 'sqlite') {
+        $con = new SQLite3(getenv('DB_SQLITE_PATH'));
+        $con->busyTimeout(10000);
+    } else {
+        $con = mysqli_connect($host, $user, $password, $db);
+        if (!$con) { 
+            die("Connection failed: " . mysqli_connect_error());    
+        }
+    }
+
+    function db_escape($con, $value){
+        if ($con instanceof SQLite3) return SQLite3::escapeString($value);
+        return mysqli_real_escape_string($con, $value);
+    }
+
+    function db_query($con, $query){
+        if (!($con instanceof SQLite3)) return mysqli_query($con, $query);
+        $result = $con->query($query);
+        if ($result === false) return false;
+        if ($result->numColumns() === 0) return true;
+        $rows = array();
+        while ($row = $result->fetchArray(SQLITE3_ASSOC)) $rows[] = $row;
+        return new ArrayIterator($rows);
+    }
+
+    function db_num_rows($result){
+        if ($result instanceof ArrayIterator) return count($result);
+        return mysqli_num_rows($result);
+    }
+
+    function db_fetch_assoc($result){
+        if (!($result instanceof ArrayIterator)) return mysqli_fetch_assoc($result);
+        if (!$result->valid()) return null;
+        $row = $result->current();
+        $result->next();
+        return $row;
     }
 ?>
\ No newline at end of file
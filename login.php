@@ -11,18 +11,18 @@ if( isset($_SESSION['username']) ) header('Location: index.php');
 if( isset($_POST['submit']) ){
         
         $username = stripslashes($_POST['username']);
-        $username = mysqli_real_escape_string($con, $username);
+        $username = db_escape($con, $username);
         $password = stripslashes($_POST['password']);
-        $password = mysqli_real_escape_string($con, $password);
+        $password = db_escape($con, $password);
        
         if(!empty(trim($username)) && !empty(trim($password))){
 
             $query      = "SELECT * FROM users WHERE username = '$username'";
-            $result     = mysqli_query($con, $query);
-            $rows       = mysqli_num_rows($result);
+            $result     = db_query($con, $query);
+            $rows       = db_num_rows($result);
 
             if ($rows != 0) {
-                $hash   = mysqli_fetch_assoc($result)['password'];
+                $hash   = db_fetch_assoc($result)['password'];
                 if(password_verify($password, $hash)){
                     $_SESSION['username'] = $username;
                
@@ -18,21 +18,21 @@ if( isset($_SESSION['user']) ) header('Location: index.php');
 if( isset($_POST['submit']) ){
         
         $username = stripslashes($_POST['username']);
-        $username = mysqli_real_escape_string($con, $username);
+        $username = db_escape($con, $username);
         $name     = stripslashes($_POST['name']);
-        $name     = mysqli_real_escape_string($con, $name);
+        $name     = db_escape($con, $name);
         $email    = stripslashes($_POST['email']);
-        $email    = mysqli_real_escape_string($con, $email);
+        $email    = db_escape($con, $email);
         $password = stripslashes($_POST['password']);
-        $password = mysqli_real_escape_string($con, $password);
+        $password = db_escape($con, $password);
         $repass   = stripslashes($_POST['repassword']);
-        $repass   = mysqli_real_escape_string($con, $repass);
+        $repass   = db_escape($con, $repass);
         if(!empty(trim($name)) && !empty(trim($username)) && !empty(trim($email)) && !empty(trim($password)) && !empty(trim($repass))){
             if($password == $repass){
                 if( cek_nama($name,$con) == 0 ){
                     $pass  = password_hash($password, PASSWORD_DEFAULT);
                     $query = "INSERT INTO users (username,name,email, password ) VALUES ('$username','$nama','$email','$pass')";
-                    $result   = mysqli_query($con, $query);
+                    $result   = db_query($con, $query);
                     if ($result) {
                         $_SESSION['username'] = $username;                       
                         header('Location: index.php');                    
@@ -52,9 +52,9 @@ if( isset($_POST['submit']) ){
     } 
 
     function cek_nama($username,$con){
-        $nama = mysqli_real_escape_string($con, $username);
+        $nama = db_escape($con, $username);
         $query = "SELECT * FROM users WHERE username = '$nama'";
-        if( $result = mysqli_query($con, $query) ) return mysqli_num_rows($result);
+        if( $result = db_query($con, $query) ) return db_num_rows($result);
     }
 ?>
         <section class="container-fluid mb-4">
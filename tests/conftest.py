@@ -1,6 +1,7 @@
 """
 Root conftest.py - Auto-discovery of all fixtures
 """
+import os
 import sys
 from pathlib import Path
 
@@ -10,3 +11,116 @@ sys.path.insert(0, str(fixtures_dir))
 
 # Import all fixtures from conftest in fixtures directory
 from conftest import *  # noqa: F401, F403
+
+# Plugins with their own hooks and options
+pytest_plugins = [
+    "plugins.chromedriver",
+    "plugins.shared_chrome",
+    "plugins.phase_timing",
+    "plugins.impact",
+    "plugins.duration_schedule",
+    "plugins.shard",
+    "plugins.failure_artifacts",
+    "plugins.navigation_timing",
+]
+
+
+def pytest_addoption(parser):
+    """Register command line options"""
+    parser.addoption(
+        "--page-backend",
+        action="store",
+        default="selenium",
+        choices=("selenium", "http"),
+        help="Backend for tests marked 'browserless': a real browser or plain HTTP requests"
+    )
+    parser.addoption(
+        "--db-backend",
+        action="store",
+        default=os.environ.get("DB_BACKEND", "mysql"),
+        choices=("mysql", "sqlite"),
+        help="Database for fixtures and the local php -S app: MySQL or the SQLite stand-in"
+    )
+    parser.addoption(
+        "--local-assets",
+        action="store_true",
+        default=os.environ.get("LOCAL_ASSETS", "") not in ("", "0", "false"),
+        help="Serve the CDN assets from a local pinned cache and block other third-party hosts"
+    )
+    parser.addoption(
+        "--page-load-strategy",
+        action="store",
+        default=os.environ.get("SELENIUM_PAGE_LOAD_STRATEGY", "normal"),
+        choices=("normal", "eager", "none"),
+        help="Chrome page load strategy: wait for 'load', for DOMContentLoaded, or not at all"
+    )
+    parser.addoption(
+        "--app-url",
+        action="store",
+        default=None,
+        help="Base URL of a running app for performance tests (default: start php -S)"
+    )
+    parser.addoption(
+        "--load-users", action="store", type=int, default=10,
+        help="Concurrent virtual users for the load test"
+    )
+    parser.addoption(
+        "--load-iterations", action="store", type=int, default=5,
+        help="register -> login flows per virtual user"
+    )
+    parser.addoption(
+        "--slo-p95-ms", action="store", type=float, default=500.0,
+        help="Maximum p95 latency per endpoint in milliseconds"
+    )
+    parser.addoption(
+        "--slo-p99-ms", action="store", type=float, default=1000.0,
+        help="Maximum p99 latency per endpoint in milliseconds"
+    )
+    parser.addoption(
+        "--slo-max-error-rate", action="store", type=float, default=0.0,
+        help="Maximum share of failed requests per endpoint (0.01 = 1%%)"
+    )
+    parser.addoption(
+        "--arrival-rates", action="store", default="5,10,20,40,80",
+        help="Comma separated arrival rates (requests/second) for the open-loop sweep, "
+             "or start:stop:steps for a linear ramp"
+    )
+    parser.addoption(
+        "--step-duration", action="store", type=float, default=5.0,
+        help="Seconds spent at each arrival rate of the open-loop sweep"
+    )
+    parser.addoption(
+        "--slo-min-knee-rps", action="store", type=float, default=0.0,
+        help="Fail the open-loop sweep if latency turns up below this arrival rate"
+    )
+    parser.addoption(
+        "--bench-iterations", action="store", type=int, default=30,
+        help="Timed iterations per benchmark"
+    )
+    parser.addoption(
+        "--bench-warmup", action="store", type=int, default=3,
+        help="Untimed warm-up iterations per benchmark"
+    )
+    parser.addoption(
+        "--bench-dir", action="store", default=".benchmarks",
+        help="Directory holding benchmark baselines"
+    )
+    parser.addoption(
+        "--bench-save-baseline", action="store_true", default=False,
+        help="Store this run's benchmark samples as the new baseline"
+    )
+    parser.addoption(
+        "--page-budgets", action="store",
+        default="login.php:ttfb_ms:p95<50,register.php:ttfb_ms:p95<50,"
+                "login.php:load_ms:p95<1000,register.php:load_ms:p95<1000",
+        help="Comma separated page:metric:pNN<limit Navigation Timing budgets for the page load test"
+    )
+    parser.addoption(
+        "--seed-users", action="store", type=int, default=10000,
+        help="Number of users bulk seeded by the seeding throughput test"
+    )
+    parser.addoption(
+        "--table-sizes", action="store", default="1000,10000",
+        help="Comma separated users-table sizes for the scaling benchmark "
+             "(larger sizes such as 100000,1000000 are opt-in)"
+    )
@@ -0,0 +1,90 @@
+"""
+Artifact Writer - write failure artifacts from a background thread
+
+Tests hand over in-memory bytes (screenshot PNG, page source, logs) and
+return immediately; a single writer thread puts them on disk and keeps the
+artifact directory under a size cap by deleting the oldest test folders.
+xdist workers share the directory, so only one process may rotate it:
+their writers are created with prune=False and the controller calls
+rotate() once they are done.
+"""
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+from pathlib import Path
+
+_STOP = object()
+UNSAFE_CHARACTERS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def folder_name(nodeid):
+    """Filesystem safe, unique folder name for one failure of nodeid"""
+    name = UNSAFE_CHARACTERS.sub("_", nodeid).strip("_")[-120:]
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{name}"
+
+
+class ArtifactWriter:
+    """Queue of artifact folders written by one daemon thread"""
+
+    def __init__(self, directory, max_bytes=200 * 1024 * 1024, prune=True):
+        """Initialize writer for directory, capped at max_bytes when prune is set"""
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.prune = prune
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, nodeid, files):
+        """Queue {filename: bytes} for writing; returns the folder they will land in"""
+        folder = self.directory / folder_name(nodeid)
+        self._queue.put((folder, files))
+        return folder
+
+    def close(self, timeout=30):
+        """Write everything still queued, then stop the thread"""
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def _run(self):
+        """Writer thread: write queued folders, then enforce the size cap"""
+        while True:
+            job = self._queue.get()
+            if job is _STOP:
+                return
+            folder, files = job
+            try:
+                folder.mkdir(parents=True, exist_ok=True)
+                for filename, data in files.items():
+                    (folder / filename).write_bytes(data)
+                if self.prune:
+                    rotate(self.directory, self.max_bytes, keep=folder)
+            except OSError as e:
+                print(f"Warning: Could not write failure artifacts to {folder}: {e}")
+
+
+def rotate(directory, max_bytes, keep=None):
+    """Delete the oldest artifact folders until directory fits max_bytes"""
+    folders = []
+    total = 0
+    for folder in Path(directory).iterdir():
+        try:
+            if not folder.is_dir():
+                continue
+            size = sum(path.stat().st_size for path in folder.iterdir() if path.is_file())
+            folders.append((folder.stat().st_mtime, folder, size))
+        except FileNotFoundError:
+            # Removed by someone else while we looked
+            continue
+        total += size
+
+    for _, folder, size in sorted(folders):
+        if total <= max_bytes:
+            break
+        if folder == keep:
+            continue
+        shutil.rmtree(folder, ignore_errors=True)
+        total -= size
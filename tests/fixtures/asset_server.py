@@ -0,0 +1,181 @@
+"""
+Asset Server - serve the pages' CDN assets locally to headless Chrome
+
+login.php and register.php load Bootstrap, jQuery and Popper from three
+CDNs. With --local-assets Chrome resolves those hosts to a local HTTPS
+server that answers from a cache of pinned copies (checked against the
+pages' integrity hashes), and every other third-party host fails to
+resolve immediately, so a page load only waits on the PHP server.
+"""
+import base64
+import hashlib
+import os
+import shutil
+import ssl
+import subprocess
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+# URL -> Subresource Integrity hash, exactly as referenced by the pages
+PINNED_ASSETS = {
+    "https://stackpath.bootstrapcdn.com/bootstrap/4.1.3/css/bootstrap.min.css":
+        "sha384-MCw98/SFnGE8fJT3GXwEOngsV7Zt27NXFoaoApmYm81iuXoPkFOJwJ8ERdknLPMO",
+    "https://code.jquery.com/jquery-3.3.1.slim.min.js":
+        "sha384-q8i/X+965DzO0rT7abK41JStQIAqVgRVzpbzo5smXKp4YfRvH+8abtTE1Pi6jizo",
+    "https://cdnjs.cloudflare.com/ajax/libs/popper.js/1.14.3/umd/popper.min.js":
+        "sha384-ZMP7rVo3mIykV+2+9J3UJ46jBk0WLaUAdn689aCwoqbBJiSnjAK/l8WvCWPIPm49",
+    "https://stackpath.bootstrapcdn.com/bootstrap/4.1.3/js/bootstrap.min.js":
+        "sha384-ChfqqxuZUCnJSK3+MXmPNIyE6ZbWh2IMqE241rYiqJxyMiZ6OW/JmZQ5stwEULTy",
+}
+CONTENT_TYPES = {".css": "text/css", ".js": "application/javascript"}
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "quiz-pengupil" / "assets"
+
+
+def integrity_of(data):
+    """sha384 Subresource Integrity value of data"""
+    return "sha384-" + base64.b64encode(hashlib.sha384(data).digest()).decode("ascii")
+
+
+class AssetCache:
+    """Pinned copies of PINNED_ASSETS, stored as <dir>/<host>/<path>"""
+
+    def __init__(self, directory=None):
+        """Initialize cache rooted at directory"""
+        self.directory = Path(directory or os.environ.get("ASSET_CACHE_DIR") or DEFAULT_CACHE_DIR)
+
+    def path_for(self, host, path):
+        """Cache file for a request to host/path (no traversal outside the cache)"""
+        target = (self.directory / host / path.lstrip("/")).resolve()
+        if self.directory.resolve() not in target.parents:
+            return None
+        return target
+
+    def missing(self):
+        """Pinned URLs without a verified local copy"""
+        result = []
+        for url, integrity in PINNED_ASSETS.items():
+            parts = urlsplit(url)
+            path = self.path_for(parts.hostname, parts.path)
+            if not path.is_file() or integrity_of(path.read_bytes()) != integrity:
+                result.append(url)
+        return result
+
+    def populate(self, timeout=5):
+        """Download missing pinned assets once; returns URLs still missing"""
+        still_missing = []
+        for url in self.missing():
+            try:
+                with urllib.request.urlopen(url, timeout=timeout) as response:
+                    data = response.read()
+            except OSError as e:
+                print(f"Warning: Could not fetch {url} for the asset cache: {e}")
+                still_missing.append(url)
+                continue
+            if integrity_of(data) != PINNED_ASSETS[url]:
+                print(f"Warning: {url} does not match its pinned integrity hash, not cached")
+                still_missing.append(url)
+                continue
+            parts = urlsplit(url)
+            path = self.path_for(parts.hostname, parts.path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(path.suffix + f".{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        return still_missing
+
+
+def ensure_certificate(directory):
+    """Self-signed certificate for the asset server, created once with openssl"""
+    directory = Path(directory)
+    cert, key = directory / "asset-server.crt", directory / "asset-server.key"
+    if cert.is_file() and key.is_file():
+        return cert, key
+    openssl = shutil.which("openssl")
+    if openssl is None:
+        return None
+    directory.mkdir(parents=True, exist_ok=True)
+    result = subprocess.run(
+        [openssl, "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "3650",
+         "-subj", "/CN=quiz-pengupil-assets", "-keyout", str(key), "-out", str(cert)],
+        capture_output=True, timeout=60
+    )
+    if result.returncode != 0:
+        return None
+    return cert, key
+
+
+class _AssetHandler(BaseHTTPRequestHandler):
+    """Answer GETs from the asset cache with CORS enabled for SRI checks"""
+
+    cache = None
+
+    def do_GET(self):
+        host = (self.headers.get("Host") or "").split(":")[0]
+        path = self.cache.path_for(host, urlsplit(self.path).path)
+        if path is None or not path.is_file():
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        data = path.read_bytes()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPES.get(path.suffix, "application/octet-stream"))
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class AssetServer:
+    """Local HTTPS server that impersonates the CDN hosts"""
+
+    def __init__(self, cache, certificate):
+        """Initialize server for cache with a (cert, key) pair"""
+        handler = type("AssetHandler", (_AssetHandler,), {"cache": cache})
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(*[str(path) for path in certificate])
+        self.httpd.socket = context.wrap_socket(self.httpd.socket, server_side=True)
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def port(self):
+        """Port the server listens on"""
+        return self.httpd.server_address[1]
+
+    def start(self):
+        """Serve in a background thread"""
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Shut the server down"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def chrome_arguments(port=None, allowed_hosts=("localhost", "127.0.0.1")):
+    """
+    Chrome flags that route the CDN hosts to port and block other hosts
+
+    Without a port (no asset server) the CDN hosts are blocked as well, so
+    pages still load without waiting for the network.
+    """
+    rules = []
+    if port is not None:
+        cdn_hosts = sorted({urlsplit(url).hostname for url in PINNED_ASSETS})
+        rules.extend(f"MAP {host} 127.0.0.1:{port}" for host in cdn_hosts)
+    rules.append("MAP * ~NOTFOUND")
+    rules.extend(f"EXCLUDE {host}" for host in allowed_hosts)
+    arguments = [f"--host-resolver-rules={', '.join(rules)}"]
+    if port is not None:
+        # The asset server's certificate is self-signed
+        arguments.append("--ignore-certificate-errors")
+    return arguments
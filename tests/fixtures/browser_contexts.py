@@ -0,0 +1,231 @@
+"""
+Browser Contexts - one shared headless Chrome, an incognito context per test
+
+A browser context is Chrome's incognito profile: its own cookies, storage
+and cache, so a PHP session started in one context is invisible to every
+other. Creating one is a DevTools call that takes milliseconds, against
+the seconds and hundreds of MB of a new Chrome process.
+
+The contexts are managed over the browser's own DevTools websocket
+(Target.* commands are not allowed from the page sessions chromedriver
+exposes), with the small synchronous client below.
+"""
+import base64
+import json
+import os
+import shutil
+import socket
+import struct
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.request
+from urllib.parse import urlsplit
+
+SHARED_CHROME_ARGUMENTS = (
+    "--headless=new",
+    "--disable-gpu",
+    "--window-size=1920,1080",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-web-resources",
+    "--no-first-run",
+    "--no-default-browser-check",
+)
+
+
+class CdpError(RuntimeError):
+    """A DevTools command failed"""
+
+
+class CdpClient:
+    """Minimal blocking DevTools client over a websocket (RFC 6455, text frames)"""
+
+    def __init__(self, ws_url, timeout=10):
+        """Connect to a DevTools websocket URL"""
+        parts = urlsplit(ws_url)
+        self._socket = socket.create_connection((parts.hostname, parts.port), timeout=timeout)
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._handshake(parts.netloc, parts.path)
+
+    @classmethod
+    def for_browser(cls, debugger_address, timeout=10):
+        """Client for the browser target of the Chrome at host:port"""
+        with urllib.request.urlopen(f"http://{debugger_address}/json/version", timeout=timeout) as response:
+            version = json.load(response)
+        return cls(version["webSocketDebuggerUrl"], timeout=timeout)
+
+    def call(self, method, params=None):
+        """Send a command and return its result, skipping events"""
+        with self._lock:
+            self._next_id += 1
+            message_id = self._next_id
+            self._send(json.dumps({"id": message_id, "method": method, "params": params or {}}))
+            while True:
+                message = json.loads(self._receive())
+                if message.get("id") != message_id:
+                    continue
+                if "error" in message:
+                    raise CdpError(f"{method}: {message['error'].get('message')}")
+                return message.get("result", {})
+
+    def close(self):
+        """Close the websocket"""
+        try:
+            self._send_frame(0x8, b"")
+        except OSError:
+            pass
+        self._socket.close()
+
+    # ----- websocket framing -----
+
+    def _handshake(self, host, path):
+        """HTTP upgrade request"""
+        key = base64.b64encode(os.urandom(16)).decode("ascii")
+        self._socket.sendall((
+            f"GET {path} HTTP/1.1\r\nHost: {host}\r\nUpgrade: websocket\r\n"
+            f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n"
+        ).encode("ascii"))
+        response = b""
+        while b"\r\n\r\n" not in response:
+            chunk = self._socket.recv(4096)
+            if not chunk:
+                raise CdpError("DevTools closed the connection during the handshake")
+            response += chunk
+        status = response.split(b"\r\n", 1)[0]
+        if b" 101 " not in status + b" ":
+            raise CdpError(f"DevTools refused the websocket: {status.decode(errors='replace')}")
+        self._buffer = response.split(b"\r\n\r\n", 1)[1]
+
+    def _send(self, text):
+        self._send_frame(0x1, text.encode("utf-8"))
+
+    def _send_frame(self, opcode, payload):
+        """Send one final, masked frame (clients must mask)"""
+        header = bytes([0x80 | opcode])
+        length = len(payload)
+        if length < 126:
+            header += bytes([0x80 | length])
+        elif length < 1 << 16:
+            header += bytes([0x80 | 126]) + struct.pack("!H", length)
+        else:
+            header += bytes([0x80 | 127]) + struct.pack("!Q", length)
+        mask = os.urandom(4)
+        masked = bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload))
+        self._socket.sendall(header + mask + masked)
+
+    def _read(self, count):
+        """Exactly count bytes from the socket"""
+        while len(self._buffer) < count:
+            chunk = self._socket.recv(max(65536, count - len(self._buffer)))
+            if not chunk:
+                raise CdpError("DevTools connection closed")
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:count], self._buffer[count:]
+        return data
+
+    def _receive(self):
+        """Next complete text message, answering pings on the way"""
+        fragments = []
+        while True:
+            first, second = self._read(2)
+            opcode = first & 0x0F
+            length = second & 0x7F
+            if length == 126:
+                length = struct.unpack("!H", self._read(2))[0]
+            elif length == 127:
+                length = struct.unpack("!Q", self._read(8))[0]
+            mask = self._read(4) if second & 0x80 else None
+            payload = self._read(length)
+            if mask:
+                payload = bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload))
+
+            if opcode == 0x8:
+                raise CdpError("DevTools closed the connection")
+            if opcode == 0x9:
+                self._send_frame(0xA, payload)
+                continue
+            if opcode == 0xA:
+                continue
+            fragments.append(payload)
+            if first & 0x80:
+                return b"".join(fragments).decode("utf-8")
+
+
+class SharedChrome:
+    """A headless Chrome with remote debugging that many WebDriver sessions attach to"""
+
+    def __init__(self, binary, arguments=()):
+        """Initialize with the Chrome binary and extra command line arguments"""
+        self.binary = binary
+        self.arguments = list(SHARED_CHROME_ARGUMENTS) + list(arguments)
+        self.user_data_dir = None
+        self.process = None
+        self.debugger_address = None
+
+    def start(self, timeout=30):
+        """Launch Chrome and wait until its DevTools port is known"""
+        self.user_data_dir = tempfile.mkdtemp(prefix="quiz-pengupil-chrome-")
+        self.process = subprocess.Popen(
+            [self.binary, "--remote-debugging-port=0", f"--user-data-dir={self.user_data_dir}",
+             *self.arguments, "about:blank"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        port_file = os.path.join(self.user_data_dir, "DevToolsActivePort")
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                self.stop()
+                raise RuntimeError(f"Shared Chrome exited with code {self.process.returncode}")
+            try:
+                with open(port_file) as f:
+                    port = f.readline().strip()
+            except OSError:
+                port = ""
+            if port:
+                self.debugger_address = f"127.0.0.1:{port}"
+                return self
+            time.sleep(0.05)
+        self.stop()
+        raise RuntimeError(f"Shared Chrome did not open a DevTools port within {timeout} s")
+
+    def stop(self):
+        """Terminate Chrome and remove its profile"""
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        if self.user_data_dir:
+            shutil.rmtree(self.user_data_dir, ignore_errors=True)
+
+
+class BrowserContexts:
+    """Create and dispose incognito browser contexts over a browser CdpClient"""
+
+    def __init__(self, client):
+        """Initialize with a CdpClient connected to the browser target"""
+        self.client = client
+
+    def open(self, url="about:blank"):
+        """New context with one page; returns (context_id, target_id)"""
+        context_id = self.client.call("Target.createBrowserContext", {"disposeOnDetach": False})["browserContextId"]
+        try:
+            target_id = self.client.call(
+                "Target.createTarget", {"url": url, "browserContextId": context_id}
+            )["targetId"]
+        except CdpError:
+            self.close(context_id)
+            raise
+        return context_id, target_id
+
+    def close(self, context_id):
+        """Dispose a context with all its pages, cookies and storage"""
+        try:
+            self.client.call("Target.disposeBrowserContext", {"browserContextId": context_id})
+        except CdpError as e:
+            print(f"Warning: Could not dispose browser context {context_id}: {e}")
@@ -1,118 +1,200 @@
 """
 Test Fixtures and Configuration
 """
+import os
+import shutil
+import socket
+import subprocess
+import time
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+
 import pytest
 import mysql.connector
 from mysql.connector import Error
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.options import Options
 
+from asset_server import AssetCache, AssetServer, chrome_arguments, ensure_certificate
+from browser_contexts import BrowserContexts, CdpClient
+from db_isolation import DbIsolation
+from db_pool import ConnectionPool
+from driver_pool import DriverPool
+from plugins.chromedriver import resolve_chromedriver
+from plugins.shared_chrome import allowed_hosts, shared_chrome_address, use_browser_contexts
+from pages.http_backend import HttpLoginPage, HttpRegisterPage, create_http_adapter
+from pages.login_page import LoginPage
+from pages.register_page import RegisterPage
+from sqlite_backend import SqliteConnection, default_path as default_sqlite_path
+from test_helpers import PasswordHasher, PhpWorker, TestDataGenerator
+from user_seeder import UserSeeder
+
 
 # ==================== Database Fixtures ====================
 
-@pytest.fixture(scope="session")
-def db_connection():
-    """Create database connection for test setup and teardown"""
+# Fixtures that let the PHP app write to the database during a test
+APP_FIXTURES = {'driver', 'driver_ui', 'login_page', 'register_page', 'app_url'}
+
+
+def _connect_mysql():
+    """Open one autocommit connection to the test database"""
     try:
-        conn = mysql.connector.connect(
+        return mysql.connector.connect(
             host='localhost',
             user='root',
             password='',
-            database='quiz_pengupil'
+            database='quiz_pengupil',
+            autocommit=True
         )
-        yield conn
-        conn.close()
     except Error as e:
         print(f"Error while connecting to MySQL: {e}")
         raise
 
 
+def _sqlite_path():
+    """Database file of the SQLite stand-in for this worker"""
+    return os.environ.get("DB_SQLITE_PATH") or default_sqlite_path(TestDataGenerator.worker_id())
+
+
+def _use_sqlite(config):
+    """True when --db-backend=sqlite (or DB_BACKEND=sqlite) is selected"""
+    return config.getoption("db_backend") == "sqlite"
+
+
+@pytest.fixture(scope="session")
+def db_pool(request):
+    """Worker-wide pool of database connections, safe to share between threads"""
+    if _use_sqlite(request.config):
+        factory = partial(SqliteConnection, _sqlite_path())
+    else:
+        factory = _connect_mysql
+    size = int(os.environ.get("DB_POOL_SIZE", 5))
+    if size < 2:
+        # db_connection keeps one connection for the whole session
+        print(f"Warning: DB_POOL_SIZE={size} leaves no connection for db_pool users, using 2")
+        size = 2
+    pool = ConnectionPool(factory, size=size)
+    yield pool
+    reporter = request.config.pluginmanager.get_plugin("terminalreporter")
+    if reporter is not None:
+        reporter.write_line(pool.format_stats())
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def db_connection(db_pool):
+    """Create database connection for test setup and teardown
+
+    The connection is borrowed from db_pool for the whole session; code
+    running in other threads should use db_pool.connection() instead.
+    """
+    with db_pool.connection() as conn:
+        yield conn
+
+
+@pytest.fixture(scope="session")
+def db_isolation(db_connection):
+    """Session-wide tracker of the rows created by each test"""
+    isolation = DbIsolation(db_connection, TestDataGenerator.namespace_like_pattern())
+    isolation.start_session()
+    return isolation
+
+
 @pytest.fixture(autouse=True)
-def db_cleanup(db_connection):
-    """Clean up test data before and after each test"""
-    cursor = db_connection.cursor()
-    
-    # Delete test users before test
-    test_usernames = ['testuser', 'newuser', 'existinguser', 'longpasstest', 
-                     'user@name#123', 'nonexistentuser', 'testuser2']
-    for username in test_usernames:
-        try:
-            cursor.execute(f"DELETE FROM users WHERE username = '{username}'")
-            db_connection.commit()
-        except:
-            pass
-    
+def db_cleanup(request, db_isolation):
+    """Remove the test's data after each test in a single round trip
+
+    Tests that never reach the PHP app run inside a transaction that is
+    rolled back; all other tests delete their tracked and app-created rows
+    with one batched DELETE.
+    """
+    app_touched = bool(APP_FIXTURES & set(request.fixturenames))
+    db_isolation.begin(DbIsolation.TRACK if app_touched else DbIsolation.ROLLBACK)
     yield
-    
-    # Clean up after test
-    for username in test_usernames:
-        try:
-            cursor.execute(f"DELETE FROM users WHERE username = '{username}'")
-            db_connection.commit()
-        except:
-            pass
-    
-    cursor.close()
+    db_isolation.finish(app_touched)
 
 
 @pytest.fixture
-def insert_test_user(db_connection):
+def insert_test_user(db_isolation):
     """Insert test user into database"""
     def _insert_user(username, email, password, name="Test User"):
-        cursor = db_connection.cursor()
         hashed_password = __hash_password(password)
         try:
-            # First delete if exists
-            cursor.execute(f"DELETE FROM users WHERE username = %s", (username,))
-            db_connection.commit()
-            
-            # Then insert
-            query = f"INSERT INTO users (username, name, email, password) VALUES (%s, %s, %s, %s)"
-            cursor.execute(query, (username, name, email, hashed_password))
-            db_connection.commit()
-            cursor.close()
+            db_isolation.insert_user(username, name, email, hashed_password)
             return True
         except Error as e:
             print(f"Error inserting user: {e}")
-            cursor.close()
             return False
     
     return _insert_user
 
 
-def __hash_password(password):
+@pytest.fixture(scope="session")
+def seed_users(db_pool, db_isolation):
     """
-    Hash password using PHP compatible algorithm
-    Note: In real scenario, you should call PHP function or use compatible library
-    For testing, we'll use a stub implementation
+    Bulk insert generated users: seed_users(100000, passwords=(...), cost=4)
+
+    Seeded users stay for the rest of the session; they are purged with the
+    worker's other leftovers when the next session starts. Rows the test
+    created before or after seeding are still cleaned up as usual.
     """
-    import subprocess
-    import json
-    
-    # Call PHP to hash password
-    php_code = f"""<?php echo password_hash('{password}', PASSWORD_DEFAULT); ?>"""
-    try:
-        result = subprocess.run(
-            ['php', '-r', f"echo password_hash('{password}', PASSWORD_DEFAULT);"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        return result.stdout.strip()
-    except:
-        # Fallback: return password as is for testing (NOT SECURE)
-        print(f"Warning: Could not hash password with PHP, using plain password for testing")
-        return password
+    def _seed(count, batch_size=1000, processes=None, cost=None, **generator_options):
+        mark = db_isolation.max_user_id()
+        with db_pool.connection() as conn:
+            seeder = UserSeeder(conn, batch_size=batch_size, processes=processes, cost=cost)
+            report = seeder.seed(TestDataGenerator.generate_users(count, **generator_options))
+        db_isolation.keep_rows_added_since(mark)
+        print(report)
+        return report
+
+    return _seed
+
+
+@pytest.fixture(scope="session")
+def php_worker():
+    """password_hash/password_verify in one php process shared by the session"""
+    if not (os.environ.get("PHP_BIN") or shutil.which("php")):
+        pytest.skip("php executable not found")
+    yield PhpWorker.shared()
+    PhpWorker.close_shared()
+
+
+def __hash_password(password):
+    """Hash password with the cached, PHP compatible bcrypt hasher"""
+    return PasswordHasher.hash(password)
 
 
 # ==================== Selenium Fixtures ====================
 
 @pytest.fixture(scope="session")
-def chrome_driver_options():
+def asset_server():
+    """Local HTTPS server for the pinned CDN assets, or None without openssl"""
+    cache = AssetCache()
+    cache.populate()
+    certificate = ensure_certificate(cache.directory)
+    if certificate is None:
+        print("Warning: openssl not found, CDN assets are blocked instead of served locally")
+        yield None
+        return
+    server = AssetServer(cache, certificate).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def chrome_driver_options(request):
     """Configure Chrome WebDriver options"""
     options = Options()
+    options.page_load_strategy = request.config.getoption("page_load_strategy")
+    # Console messages for the failure artifacts
+    options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+    if request.config.getoption("local_assets"):
+        server = request.getfixturevalue("asset_server")
+        port = server.port if server is not None else None
+        for argument in chrome_arguments(port, allowed_hosts(request.config)):
+            options.add_argument(argument)
     options.add_argument("--headless")  # Run in headless mode for CI/CD
     options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1920,1080")
@@ -122,36 +204,231 @@ def chrome_driver_options():
     return options
 
 
-@pytest.fixture
-def driver(chrome_driver_options):
-    """Setup WebDriver for each test"""
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_driver_options)
-    driver.implicitly_wait(10)
+@pytest.fixture(scope="session")
+def chromedriver_path(request):
+    """Chromedriver binary, resolved once per run and cached on disk"""
+    return resolve_chromedriver(request.config)
+
+
+def _create_driver(options, driver_path):
+    """Launch a new Chrome WebDriver"""
+    service = Service(driver_path)
+    # No implicit wait: page objects use explicit, condition based waits
+    return webdriver.Chrome(service=service, options=options)
+
+
+@pytest.fixture(scope="session")
+def driver_pool(chrome_driver_options, chromedriver_path):
+    """Worker-scoped pool of warm WebDrivers, reset between tests"""
+    size = os.environ.get("SELENIUM_POOL_SIZE", 1)
+    base_urls = [os.environ.get("BASE_URL", "http://localhost/quiz")]
+    pool = DriverPool(
+        lambda: _create_driver(chrome_driver_options, chromedriver_path), size=size, base_urls=base_urls
+    )
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def browser_contexts(request):
+    """Creates the per-test incognito contexts in the shared Chrome"""
+    client = CdpClient.for_browser(shared_chrome_address(request.config))
+    yield BrowserContexts(client)
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def context_driver(request, chromedriver_path):
+    """This worker's WebDriver session, attached to the shared Chrome"""
+    options = Options()
+    options.page_load_strategy = request.config.getoption("page_load_strategy")
+    options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+    options.debugger_address = shared_chrome_address(request.config)
+    driver = _create_driver(options, chromedriver_path)
     yield driver
+    # Detaches chromedriver; the shared Chrome is stopped by the plugin
     driver.quit()
 
 
+def _switch_to_target(driver, target_id):
+    """Make the page target_id the driver's current window"""
+    for handle in driver.window_handles:
+        # chromedriver's window handles are DevTools target ids
+        if handle == target_id or handle.endswith(target_id):
+            driver.switch_to.window(handle)
+            return
+    raise RuntimeError(f"Browser context page {target_id} is not visible to chromedriver")
+
+
+@contextmanager
+def _checkout_driver(request):
+    """Open a browser context, borrow a pooled driver, or launch a fresh one for fresh_driver tests"""
+    if use_browser_contexts(request.config) and not request.node.get_closest_marker("fresh_driver"):
+        contexts = request.getfixturevalue("browser_contexts")
+        driver = request.getfixturevalue("context_driver")
+        context_id, target_id = contexts.open()
+        try:
+            _switch_to_target(driver, target_id)
+            yield driver
+        finally:
+            contexts.close(context_id)
+        return
+
+    if request.node.get_closest_marker("fresh_driver"):
+        options = request.getfixturevalue("chrome_driver_options")
+        driver = _create_driver(options, request.getfixturevalue("chromedriver_path"))
+        try:
+            yield driver
+        finally:
+            driver.quit()
+        return
+
+    pool = request.getfixturevalue("driver_pool")
+    driver = pool.acquire()
+    try:
+        yield driver
+    finally:
+        pool.release(driver)
+
+
+@pytest.fixture
+def driver(request):
+    """Setup WebDriver for each test
+
+    Drivers come from the pool, or with --driver-mode=context are a fresh
+    incognito context in the shared Chrome; mark a test with
+    @pytest.mark.fresh_driver to get a new Chrome process that is quit
+    after the test.
+    """
+    with _checkout_driver(request) as driver:
+        yield driver
+
+
 @pytest.fixture
-def driver_ui(chrome_driver_options):
+def driver_ui(request):
     """Setup WebDriver for UI tests (non-headless for debugging)"""
     # Uncomment the next line to run UI tests in non-headless mode
     # chrome_driver_options.headless = False
-    
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_driver_options)
-    driver.implicitly_wait(10)
-    yield driver
-    driver.quit()
+    with _checkout_driver(request) as driver:
+        yield driver
+
+
+# ==================== Page Object Fixtures ====================
+
+@pytest.fixture(scope="session")
+def http_adapter():
+    """Keep-alive connection pool shared by the HTTP page objects"""
+    adapter = create_http_adapter()
+    yield adapter
+    adapter.close()
+
+
+def _use_http_backend(request):
+    """True when a browserless test runs with --page-backend=http"""
+    return (request.config.getoption("page_backend") == "http"
+            and request.node.get_closest_marker("browserless") is not None)
+
+
+def _http_page_kwargs(request):
+    """Adapter and, for the SQLite stand-in, the php -S URL for HTTP page objects"""
+    kwargs = {'adapter': request.getfixturevalue("http_adapter")}
+    if _use_sqlite(request.config):
+        # Only an app started with DB_BACKEND=sqlite sees the fixtures' rows
+        kwargs['base_url'] = request.getfixturevalue("app_url")
+    return kwargs
+
+
+@pytest.fixture
+def login_page(request):
+    """Login page object, browser or HTTP backed"""
+    if _use_http_backend(request):
+        return HttpLoginPage(**_http_page_kwargs(request))
+    return LoginPage(request.getfixturevalue("driver"))
+
+
+@pytest.fixture
+def register_page(request):
+    """Register page object, browser or HTTP backed"""
+    if _use_http_backend(request):
+        return HttpRegisterPage(**_http_page_kwargs(request))
+    return RegisterPage(request.getfixturevalue("driver"))
+
+
+# ==================== Application Server Fixtures ====================
+
+APP_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _free_port():
+    """Ask the OS for an unused TCP port"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_port(port, timeout=10):
+    """Wait until something accepts connections on port"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return True
+        time.sleep(0.05)
+    return False
+
+
+@pytest.fixture(scope="session")
+def php_server(request):
+    """Serve the app with the PHP built-in server on a free port"""
+    php = shutil.which("php")
+    if php is None:
+        pytest.skip("php executable not found")
+
+    env = dict(os.environ)
+    if _use_sqlite(request.config):
+        # koneksi.php opens the same SQLite file as the fixtures
+        env.update(DB_BACKEND="sqlite", DB_SQLITE_PATH=_sqlite_path())
+        request.getfixturevalue("db_pool")  # creates the schema
+
+    port = _free_port()
+    # output_buffering lets header('Location') work after HTML output, like php.ini-development
+    process = subprocess.Popen(
+        [php, "-d", "output_buffering=4096", "-S", f"127.0.0.1:{port}", "-t", str(APP_ROOT)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env=env
+    )
+    try:
+        if not _wait_for_port(port):
+            pytest.fail("PHP built-in server did not start")
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        process.terminate()
+        process.wait(timeout=5)
+
+
+@pytest.fixture(scope="session")
+def app_url(request):
+    """Base URL for performance tests: --app-url or a local php -S"""
+    url = request.config.getoption("app_url")
+    if url:
+        return url.rstrip("/")
+    return request.getfixturevalue("php_server")
 
 
 # ==================== Test Data Fixtures ====================
 
+@pytest.fixture
+def test_data():
+    """Worker-namespaced generator for usernames and emails"""
+    return TestDataGenerator
+
+
 @pytest.fixture
 def valid_login_data():
     """Valid login test data"""
     return {
-        'username': 'testuser',
+        'username': TestDataGenerator.generate_username('testuser'),
         'password': 'Test@123'
     }
 
@@ -161,37 +438,27 @@ def valid_register_data():
     """Valid register test data"""
     return {
         'name': 'John Doe',
-        'email': 'john@example.com',
-        'username': 'newuser',
+        'email': TestDataGenerator.generate_email('john'),
+        'username': TestDataGenerator.generate_username('newuser'),
         'password': 'NewPass@123',
         'repassword': 'NewPass@123'
     }
 
 
 @pytest.fixture
-def existing_user_data(db_connection):
+def existing_user_data(db_isolation):
     """Create and return existing user data"""
-    username = 'existinguser'
-    email = 'existing@example.com'
+    username = TestDataGenerator.generate_username('existinguser')
+    email = TestDataGenerator.generate_email('existing')
     password = 'Existing@123'
     name = 'Existing User'
     
-    cursor = db_connection.cursor()
     hashed_password = __hash_password(password)
     
     try:
-        # Delete first if exists
-        cursor.execute(f"DELETE FROM users WHERE username = %s", (username,))
-        db_connection.commit()
-        
-        # Insert test user
-        query = f"INSERT INTO users (username, name, email, password) VALUES (%s, %s, %s, %s)"
-        cursor.execute(query, (username, name, email, hashed_password))
-        db_connection.commit()
+        db_isolation.insert_user(username, name, email, hashed_password)
     except Error as e:
         print(f"Error creating existing user: {e}")
-    finally:
-        cursor.close()
     
     return {
         'username': username,
@@ -229,3 +496,12 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "stub: mark test as stub (not yet implemented)"
     )
+    config.addinivalue_line(
+        "markers", "fresh_driver: use a new Chrome process instead of a pooled driver"
+    )
+    config.addinivalue_line(
+        "markers", "browserless: test only checks server responses and can run over HTTP"
+    )
+    config.addinivalue_line(
+        "markers", "benchmark: mark test as page object microbenchmark"
+    )
@@ -0,0 +1,116 @@
+"""
+Database Isolation - remove the rows a test creates in one round trip
+"""
+
+
+class DbIsolation:
+    """
+    Track users created during a test and clean them up in one statement
+
+    Two modes are used per test:
+    - rollback: the test never reaches the PHP app, so fixture inserts stay
+      in an open transaction that is rolled back at teardown.
+    - track: the app must see the fixture rows, so inserts are committed.
+      Rows created by the fixtures are tracked by id, rows created by the
+      app are found above the session high-water mark inside the worker's
+      username namespace, and both are removed with a single batched DELETE.
+      Id ranges registered with keep_rows_added_since (bulk seeded users)
+      are left alone unless a fixture tracked the row itself.
+    """
+
+    ROLLBACK = "rollback"
+    TRACK = "track"
+
+    def __init__(self, connection, username_pattern):
+        """Initialize with a DB-API connection and the worker's LIKE pattern"""
+        self.connection = connection
+        self.username_pattern = username_pattern
+        self.high_water_mark = 0
+        self.mode = self.TRACK
+        self._ids = set()
+        self._in_transaction = False
+        # (low, high] id ranges kept for the session although in the namespace
+        self._kept = []
+
+    def start_session(self):
+        """Purge leftovers of earlier runs and record the high-water mark"""
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(
+                "DELETE FROM users WHERE username LIKE %s", (self.username_pattern,)
+            )
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM users")
+            self.high_water_mark = cursor.fetchone()[0]
+        finally:
+            cursor.close()
+
+    def max_user_id(self):
+        """Highest id currently in the users table"""
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM users")
+            return cursor.fetchone()[0]
+        finally:
+            cursor.close()
+
+    def keep_rows_added_since(self, mark):
+        """Exclude rows with mark < id <= current max, e.g. bulk seeded users, from cleanup"""
+        high = self.max_user_id()
+        if high > mark:
+            self._kept.append((mark, high))
+
+    def begin(self, mode):
+        """Start isolating a test in the given mode (no DB round trip)"""
+        self.mode = mode
+        self._ids = set()
+        self._in_transaction = False
+
+    def insert_user(self, username, name, email, hashed_password):
+        """Insert or replace a user and remember it for cleanup"""
+        if self.mode == self.ROLLBACK and not self._in_transaction:
+            self.connection.start_transaction()
+            self._in_transaction = True
+
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(
+                "INSERT INTO users (username, name, email, password) "
+                "VALUES (%s, %s, %s, %s) "
+                "ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id), name = VALUES(name), "
+                "email = VALUES(email), password = VALUES(password)",
+                (username, name, email, hashed_password)
+            )
+            user_id = cursor.lastrowid
+        finally:
+            cursor.close()
+
+        if user_id:
+            self._ids.add(user_id)
+        return user_id
+
+    def finish(self, app_touched):
+        """Undo the test's changes with at most one round trip"""
+        if self._in_transaction:
+            self.connection.rollback()
+            self._in_transaction = False
+            return
+
+        if not app_touched and not self._ids:
+            return
+
+        condition = "username LIKE %s"
+        params = [self.high_water_mark, self.username_pattern]
+        for low, high in self._kept:
+            condition += " AND NOT (id > %s AND id <= %s)"
+            params.extend((low, high))
+        if self._ids:
+            condition += f" OR id IN ({', '.join(['%s'] * len(self._ids))})"
+            params.extend(sorted(self._ids))
+
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(
+                f"DELETE FROM users WHERE id > %s AND ({condition})", tuple(params)
+            )
+        finally:
+            cursor.close()
@@ -0,0 +1,164 @@
+"""
+Database Pool - share database connections between fixtures, tools and threads
+"""
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+from mysql.connector import Error
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of database connections with health checks and wait stats
+
+    A connection that sat idle for longer than validate_after seconds is
+    pinged (with reconnect) before it is handed out; one that cannot be
+    revived is replaced by a new connection. A checkout that finds every
+    connection taken for longer than timeout seconds raises TimeoutError
+    rather than hanging the run.
+    """
+
+    DEFAULT_TIMEOUT = 30.0
+
+    def __init__(self, factory, size=5, validate_after=30.0):
+        """Initialize pool with a connection factory and maximum size"""
+        self.factory = factory
+        self.size = max(1, int(size))
+        self.validate_after = validate_after
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._all = []
+        self._stats = {
+            'checkouts': 0, 'waits': 0, 'wait_s': 0.0, 'max_wait_s': 0.0,
+            'created': 0, 'reconnects': 0, 'discarded': 0,
+        }
+
+    def acquire(self, timeout=DEFAULT_TIMEOUT):
+        """Get a healthy connection, waiting for one if the pool is exhausted"""
+        start = time.perf_counter()
+        waited = False
+        while True:
+            try:
+                connection, released_at = self._idle.get_nowait()
+            except queue.Empty:
+                connection, released_at, blocked = self._create_or_wait(timeout)
+                waited = waited or blocked
+
+            if time.monotonic() - released_at < self.validate_after or self.is_healthy(connection):
+                break
+            self._discard(connection)
+
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._stats['checkouts'] += 1
+            if waited:
+                self._stats['waits'] += 1
+                self._stats['wait_s'] += elapsed
+                self._stats['max_wait_s'] = max(self._stats['max_wait_s'], elapsed)
+        return connection
+
+    def release(self, connection):
+        """Roll back any open transaction and return the connection"""
+        try:
+            if connection.in_transaction:
+                connection.rollback()
+        except Error as e:
+            print(f"Warning: Could not reset pooled connection, replacing it: {e}")
+            self._discard(connection)
+            return
+        self._idle.put((connection, time.monotonic()))
+
+    @contextmanager
+    def connection(self, timeout=DEFAULT_TIMEOUT):
+        """Borrow a connection for the duration of a with block"""
+        connection = self.acquire(timeout)
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def is_healthy(self, connection):
+        """Ping the server, reconnecting once if the link dropped"""
+        try:
+            if connection.is_connected():
+                return True
+            connection.ping(reconnect=True, attempts=1, delay=0)
+        except Error:
+            return False
+        with self._lock:
+            self._stats['reconnects'] += 1
+        return True
+
+    def stats(self):
+        """Checkout counts and time spent waiting for a free connection"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['in_use'] = self._created - self._idle.qsize()
+        stats['mean_wait_ms'] = stats['wait_s'] / stats['waits'] * 1000 if stats['waits'] else 0.0
+        return stats
+
+    def format_stats(self):
+        """One line summary of stats()"""
+        stats = self.stats()
+        return (
+            f"DB pool: {stats['checkouts']} checkouts, {stats['created']} connections, "
+            f"{stats['waits']} waited ({stats['wait_s'] * 1000:.1f} ms total, "
+            f"{stats['mean_wait_ms']:.1f} ms mean, {stats['max_wait_s'] * 1000:.1f} ms max), {stats['reconnects']} reconnects"
+        )
+
+    def close(self):
+        """Close every connection created by this pool"""
+        with self._lock:
+            connections, self._all = self._all, []
+            self._created = 0
+        while not self._idle.empty():
+            self._idle.get_nowait()
+        for connection in connections:
+            self._close(connection)
+
+    def _create_or_wait(self, timeout):
+        """Create a new connection or block until one is released"""
+        with self._lock:
+            can_create = self._created < self.size
+            if can_create:
+                self._created += 1
+        if not can_create:
+            try:
+                connection, released_at = self._idle.get(timeout=timeout)
+            except queue.Empty:
+                raise TimeoutError(
+                    f"No database connection free within {timeout} s: all {self.size} are checked out "
+                    f"(raise DB_POOL_SIZE if fixtures hold connections for the whole session)"
+                ) from None
+            return connection, released_at, True
+
+        try:
+            connection = self.factory()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+        with self._lock:
+            self._all.append(connection)
+            self._stats['created'] += 1
+        return connection, time.monotonic(), False
+
+    def _discard(self, connection):
+        """Drop a broken connection so that a fresh one gets created"""
+        with self._lock:
+            if connection in self._all:
+                self._all.remove(connection)
+                self._created -= 1
+            self._stats['discarded'] += 1
+        self._close(connection)
+
+    @staticmethod
+    def _close(connection):
+        """Close connection, ignoring errors from already dead links"""
+        try:
+            connection.close()
+        except Error:
+            pass
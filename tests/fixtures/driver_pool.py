@@ -0,0 +1,153 @@
+"""
+WebDriver Pool - reuse warm Chrome instances across tests
+"""
+import queue
+import threading
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+
+class DriverPool:
+    """
+    Pool of warm WebDriver instances shared by the tests of one worker
+
+    A checkout that finds every driver taken for longer than timeout
+    seconds raises TimeoutError, e.g. when a test leaked its driver.
+    """
+
+    RESET_URL = "about:blank"
+    # Below the 30 s pytest-timeout, so the leak is reported instead of the test being killed
+    DEFAULT_TIMEOUT = 20.0
+
+    def __init__(self, factory, size=1, base_urls=()):
+        """Initialize pool with a driver factory, maximum size and the app's base URLs"""
+        self.factory = factory
+        self.size = max(1, int(size))
+        # Origins whose storage is cleared on reset, besides the page left open
+        self.origins = {origin for origin in map(origin_of, base_urls) if origin}
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._all = []
+
+    def acquire(self, timeout=DEFAULT_TIMEOUT):
+        """Get a healthy driver, creating one if the pool is not full"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                driver = self._create_or_wait(timeout)
+
+            if self.is_healthy(driver):
+                return driver
+            self._discard(driver)
+
+    def release(self, driver):
+        """Reset driver state and return it to the pool"""
+        try:
+            self.reset(driver)
+        except WebDriverException as e:
+            print(f"Warning: Could not reset pooled driver, replacing it: {e}")
+            self._discard(driver)
+            return
+        self._idle.put(driver)
+
+    def reset(self, driver):
+        """Clear cookies, storage and session, then go back to about:blank"""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        origins = set(self.origins)
+        current = origin_of(driver.current_url)
+        if current:
+            origins.add(current)
+
+        driver.delete_all_cookies()
+        # Works with every driver, but only for the origin still open
+        driver.execute_script(
+            "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+        )
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            # CDP takes one concrete origin per call, no wildcard
+            for origin in sorted(origins):
+                driver.execute_cdp_cmd(
+                    "Storage.clearDataForOrigin",
+                    {"origin": origin, "storageTypes": "all"}
+                )
+        except (WebDriverException, AttributeError):
+            # Non-Chromium drivers: cookies and the open origin were cleared above
+            pass
+        driver.get(self.RESET_URL)
+
+    @staticmethod
+    def is_healthy(driver):
+        """Check the browser session still answers commands"""
+        try:
+            driver.execute_script("return 1")
+            return len(driver.window_handles) > 0
+        except WebDriverException:
+            return False
+
+    def close(self):
+        """Quit every driver created by this pool"""
+        with self._lock:
+            drivers, self._all = self._all, []
+            self._created = 0
+        while not self._idle.empty():
+            self._idle.get_nowait()
+        for driver in drivers:
+            self._quit(driver)
+
+    def _create_or_wait(self, timeout):
+        """Create a new driver or block until one is released"""
+        with self._lock:
+            can_create = self._created < self.size
+            if can_create:
+                self._created += 1
+        if not can_create:
+            try:
+                return self._idle.get(timeout=timeout)
+            except queue.Empty:
+                raise TimeoutError(
+                    f"No WebDriver free within {timeout} s: all {self.size} are checked out "
+                    f"(a test may have leaked its driver, or raise SELENIUM_POOL_SIZE)"
+                ) from None
+
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+        with self._lock:
+            self._all.append(driver)
+        return driver
+
+    def _discard(self, driver):
+        """Drop a broken driver so that a fresh one gets created"""
+        with self._lock:
+            if driver in self._all:
+                self._all.remove(driver)
+                self._created -= 1
+        self._quit(driver)
+
+    @staticmethod
+    def _quit(driver):
+        """Quit driver, ignoring errors from already dead sessions"""
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+
+def origin_of(url):
+    """'http://localhost/quiz/login.php' -> 'http://localhost'; None for about:, data: etc."""
+    parts = urlsplit(url or "")
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
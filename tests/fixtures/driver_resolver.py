@@ -0,0 +1,127 @@
+"""
+ChromeDriver Resolver - find the driver binary once and cache it on disk
+
+The cache is keyed by the Chrome binary's path, size and mtime, so a warm
+lookup is a couple of stat() calls: no subprocess and no network. The
+Chrome version is only read on a cache miss, and in offline mode a miss
+is resolved from PATH or the webdriver-manager cache, never the network.
+"""
+import json
+import os
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+CHROME_CANDIDATES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+DEFAULT_CACHE_FILE = Path.home() / ".cache" / "quiz-pengupil" / "chromedriver.json"
+WDM_CACHE_DIR = Path.home() / ".wdm" / "drivers" / "chromedriver"
+VERSION_PATTERN = re.compile(r"(\d+)\.(\d+)\.(\d+)(?:\.(\d+))?")
+
+
+class ChromeDriverNotFound(RuntimeError):
+    """No usable chromedriver could be resolved"""
+
+
+def find_chrome_binary():
+    """Return the real path of the local Chrome/Chromium binary, or None"""
+    explicit = os.environ.get("CHROME_BIN")
+    candidates = [explicit] if explicit else [shutil.which(name) for name in CHROME_CANDIDATES]
+    for candidate in candidates:
+        if candidate and os.path.exists(candidate):
+            return os.path.realpath(candidate)
+    return None
+
+
+def read_version(binary):
+    """Return the 'major.minor.build.patch' version printed by binary, or None"""
+    try:
+        result = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION_PATTERN.search(result.stdout)
+    return match.group(0) if match else None
+
+
+def _major(version):
+    return version.split(".")[0] if version else None
+
+
+class ChromeDriverResolver:
+    """Resolve the chromedriver matching the local Chrome, with a disk cache"""
+
+    def __init__(self, cache_file=None, offline=False):
+        """Initialize resolver"""
+        self.cache_file = Path(cache_file or os.environ.get("CHROMEDRIVER_CACHE") or DEFAULT_CACHE_FILE)
+        self.offline = offline
+
+    def resolve(self):
+        """Return the chromedriver path, downloading only when online and uncached"""
+        explicit = os.environ.get("CHROMEDRIVER_PATH")
+        if explicit:
+            return explicit
+
+        chrome = find_chrome_binary()
+        key = self._cache_key(chrome)
+        cache = self._load_cache()
+        cached = cache.get(key)
+        if cached and os.path.exists(cached["driver_path"]):
+            return cached["driver_path"]
+
+        chrome_version = read_version(chrome) if chrome else None
+        driver_path = self._find_local_driver(chrome_version)
+        if driver_path is None:
+            if self.offline:
+                raise ChromeDriverNotFound(
+                    f"No chromedriver for Chrome {chrome_version or '(not found)'} on PATH or in "
+                    f"{WDM_CACHE_DIR}; set CHROMEDRIVER_PATH or run once online to fill the cache"
+                )
+            from webdriver_manager.chrome import ChromeDriverManager
+            driver_path = ChromeDriverManager().install()
+
+        cache[key] = {"chrome_version": chrome_version, "driver_path": driver_path}
+        self._save_cache(cache)
+        return driver_path
+
+    @staticmethod
+    def _cache_key(chrome):
+        """Cheap identity of the installed Chrome build"""
+        if chrome is None:
+            return "no-chrome"
+        stat = os.stat(chrome)
+        return f"{chrome}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    @staticmethod
+    def _find_local_driver(chrome_version):
+        """Look for a matching chromedriver on PATH or in the webdriver-manager cache"""
+        candidates = []
+        on_path = shutil.which("chromedriver")
+        if on_path:
+            candidates.append(on_path)
+        if WDM_CACHE_DIR.is_dir():
+            candidates.extend(
+                str(path) for path in sorted(WDM_CACHE_DIR.rglob("chromedriver*"), reverse=True)
+                if path.is_file() and os.access(path, os.X_OK)
+            )
+
+        wanted = _major(chrome_version)
+        for candidate in candidates:
+            if wanted is None or _major(read_version(candidate)) == wanted:
+                return candidate
+        return None
+
+    def _load_cache(self):
+        """Read the cache file, treating a missing or corrupt file as empty"""
+        try:
+            with open(self.cache_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self, cache):
+        """Write the cache atomically so parallel workers never see half a file"""
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp, self.cache_file)
@@ -0,0 +1,157 @@
+"""
+SQLite Backend - local stand-in for the quiz_pengupil MySQL database
+
+The database is a single SQLite file, on /dev/shm when available so it
+lives in memory, that the fixtures open through SqliteConnection and the
+PHP app opens through koneksi.php when DB_BACKEND=sqlite. SqliteConnection
+mimics the part of the mysql.connector API the fixtures use and rewrites
+the MySQL-only SQL they send (%s placeholders, LIKE with backslash escapes,
+ON DUPLICATE KEY UPDATE) to SQLite.
+"""
+import os
+import re
+import sqlite3
+import tempfile
+
+from mysql.connector import errors
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username VARCHAR(50) NOT NULL UNIQUE COLLATE NOCASE,
+    name VARCHAR(100),
+    email VARCHAR(100) NOT NULL UNIQUE COLLATE NOCASE,
+    password VARCHAR(255) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+LIKE_PARAM = re.compile(r"\bLIKE\s+%s", re.IGNORECASE)
+ON_DUPLICATE = re.compile(r"\bON\s+DUPLICATE\s+KEY\s+UPDATE\b(.*)$", re.IGNORECASE | re.DOTALL)
+LAST_INSERT_ID = re.compile(r"\s*\bid\s*=\s*LAST_INSERT_ID\(id\)\s*,?", re.IGNORECASE)
+VALUES_FUNCTION = re.compile(r"\bVALUES\((\w+)\)", re.IGNORECASE)
+
+
+def default_path(worker_id):
+    """Per-worker database file, in shared memory when the OS has it"""
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(directory, f"quiz_pengupil_{worker_id}.sqlite")
+
+
+def translate(statement):
+    """Rewrite the MySQL dialect used by the fixtures into SQLite"""
+    statement = LIKE_PARAM.sub(r"LIKE %s ESCAPE '\\'", statement)
+    match = ON_DUPLICATE.search(statement)
+    if match:
+        assignments = VALUES_FUNCTION.sub(r"excluded.\1", LAST_INSERT_ID.sub("", match.group(1)))
+        statement = statement[:match.start()] + "ON CONFLICT DO UPDATE SET" + assignments
+    if statement.lstrip().upper().startswith("INSERT"):
+        statement += " RETURNING id"
+    return statement.replace("%s", "?")
+
+
+def _mysql_error(error):
+    """Map a sqlite3 error onto the mysql.connector error the fixtures catch"""
+    if isinstance(error, sqlite3.IntegrityError):
+        return errors.IntegrityError(msg=str(error))
+    return errors.DatabaseError(msg=str(error))
+
+
+class SqliteCursor:
+    """mysql.connector style cursor over a sqlite3 cursor"""
+
+    def __init__(self, connection, dictionary=False):
+        """Initialize cursor"""
+        self._cursor = connection.cursor()
+        self._dictionary = dictionary
+        self._rows = []
+        self.lastrowid = None
+        self.rowcount = -1
+
+    def execute(self, statement, params=()):
+        """Run one statement with %s placeholders"""
+        try:
+            self._cursor.execute(translate(statement), tuple(params or ()))
+            self._rows = self._cursor.fetchall() if self._cursor.description else []
+        except sqlite3.Error as e:
+            raise _mysql_error(e) from e
+        if statement.lstrip().upper().startswith("INSERT"):
+            # RETURNING id reports both inserted and upserted rows
+            self.lastrowid = self._rows[-1][0] if self._rows else None
+            self.rowcount = len(self._rows)
+            self._rows = []
+        else:
+            self.rowcount = self._cursor.rowcount
+
+    def fetchone(self):
+        """Next row, or None"""
+        return self._convert(self._rows.pop(0)) if self._rows else None
+
+    def fetchall(self):
+        """All remaining rows"""
+        rows, self._rows = self._rows, []
+        return [self._convert(row) for row in rows]
+
+    def close(self):
+        """Close cursor"""
+        self._cursor.close()
+
+    def _convert(self, row):
+        if not self._dictionary:
+            return tuple(row)
+        return {column[0]: value for column, value in zip(self._cursor.description, row)}
+
+
+class SqliteConnection:
+    """mysql.connector style connection to the SQLite stand-in"""
+
+    def __init__(self, path, autocommit=True):
+        """Open the database file and create the users table if needed"""
+        self.path = path
+        self.autocommit = autocommit
+        # isolation_level=None: transactions only start on start_transaction()
+        self._connection = sqlite3.connect(
+            path, timeout=10, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute(SCHEMA)
+        if not autocommit:
+            self.start_transaction()
+
+    @property
+    def in_transaction(self):
+        """True while a transaction is open"""
+        return self._connection.in_transaction
+
+    def cursor(self, dictionary=False):
+        """New cursor; dictionary=True returns rows as dicts"""
+        return SqliteCursor(self._connection, dictionary)
+
+    def start_transaction(self):
+        """Begin a transaction"""
+        self._connection.execute("BEGIN")
+
+    def commit(self):
+        """Commit the open transaction, if any"""
+        if self._connection.in_transaction:
+            self._connection.execute("COMMIT")
+        if not self.autocommit:
+            self.start_transaction()
+
+    def rollback(self):
+        """Roll back the open transaction, if any"""
+        if self._connection.in_transaction:
+            self._connection.execute("ROLLBACK")
+        if not self.autocommit:
+            self.start_transaction()
+
+    def is_connected(self):
+        """A local file is always reachable"""
+        return True
+
+    def ping(self, reconnect=False, attempts=1, delay=0):
+        """Nothing to reconnect to"""
+
+    def close(self):
+        """Close the database file"""
+        self._connection.close()
@@ -0,0 +1,123 @@
+"""
+User Seeder - bulk load generated users into the users table
+
+Records are consumed lazily in batches, so seeding 100k users never holds
+100k rows in memory. Passwords that have not been hashed yet are hashed in
+a process pool while the previous batch is being inserted, and each batch
+is written with one multi-row INSERT.
+"""
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from test_helpers import PasswordHasher
+
+INSERT_PREFIX = "INSERT INTO users (username, name, email, password) VALUES "
+INSERT_SUFFIX = (
+    " ON DUPLICATE KEY UPDATE name = VALUES(name), email = VALUES(email), "
+    "password = VALUES(password)"
+)
+
+
+def _hash_passwords(passwords, cost):
+    """Process pool task: hash a chunk of passwords"""
+    return [PasswordHasher.compute(password, cost) for password in passwords]
+
+
+def _chunks(iterable, size):
+    """Yield lists of up to size items from iterable"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class SeedReport:
+    """Outcome of one seeding run"""
+
+    def __init__(self, rows, seconds, hashed):
+        """Initialize report"""
+        self.rows = rows
+        self.seconds = seconds
+        self.hashed = hashed
+
+    @property
+    def rows_per_sec(self):
+        """Insert throughput over the whole run"""
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return (
+            f"Seeded {self.rows} users in {self.seconds:.2f} s "
+            f"({self.rows_per_sec:.0f} rows/s, {self.hashed} distinct hashes)"
+        )
+
+
+class UserSeeder:
+    """Stream user records into MySQL with batched multi-row inserts"""
+
+    def __init__(self, connection, batch_size=1000, processes=None, cost=None):
+        """
+        Initialize seeder
+
+        cost: bcrypt cost for seeded passwords; PHP password_verify accepts
+        any cost, so a low one keeps seeding and logins of seeded users fast.
+        """
+        self.connection = connection
+        self.batch_size = batch_size
+        self.processes = processes or os.cpu_count() or 1
+        self.cost = cost
+        self._hashes = {}
+        self._in_flight = set()
+
+    def seed(self, users):
+        """Insert every record of the users iterable and return a SeedReport"""
+        start = time.perf_counter()
+        rows = 0
+        hashed = 0
+        with ProcessPoolExecutor(max_workers=self.processes) as pool:
+            pending = None
+            for batch in _chunks(users, self.batch_size):
+                # Hash the next batch while the current one is inserted
+                hashing = self._submit_hashes(pool, batch)
+                if pending is not None:
+                    rows += self._insert(*pending)
+                pending = (batch, hashing)
+                hashed += sum(len(passwords) for passwords, _ in hashing)
+            if pending is not None:
+                rows += self._insert(*pending)
+        return SeedReport(rows, time.perf_counter() - start, hashed)
+
+    def _submit_hashes(self, pool, batch):
+        """Queue hashing of the batch's passwords that are not cached yet"""
+        missing = sorted({user['password'] for user in batch} - self._hashes.keys() - self._in_flight)
+        if not missing:
+            return []
+        self._in_flight.update(missing)
+        chunk_size = max(1, -(-len(missing) // self.processes))
+        return [
+            (chunk, pool.submit(_hash_passwords, chunk, self.cost))
+            for chunk in _chunks(missing, chunk_size)
+        ]
+
+    def _insert(self, batch, hashing):
+        """Write one batch with a single INSERT statement"""
+        for passwords, future in hashing:
+            self._hashes.update(zip(passwords, future.result()))
+            self._in_flight.difference_update(passwords)
+
+        params = []
+        for user in batch:
+            params.extend((user['username'], user['name'], user['email'], self._hashes[user['password']]))
+        statement = INSERT_PREFIX + ", ".join(["(%s, %s, %s, %s)"] * len(batch)) + INSERT_SUFFIX
+
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(statement, params)
+        finally:
+            cursor.close()
+        self.connection.commit()
+        return len(batch)
@@ -0,0 +1,211 @@
+"""
+Base Page Object Model
+"""
+from selenium.common.exceptions import (
+    NoSuchElementException, StaleElementReferenceException, WebDriverException
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from pages import navigation_timing
+
+
+class BasePage:
+    """Shared behaviour for page objects: condition based waits"""
+
+    # Locators
+    FORM = (By.CSS_SELECTOR, "form")
+    SUBMIT_BUTTON = (By.CSS_SELECTOR, "button[name='submit']")
+    ERROR_MESSAGE = (By.CSS_SELECTOR, ".alert-danger")
+
+    TIMEOUT = 10
+    POLL_INTERVAL = 0.05
+
+    # False: fill forms with one script call; True: real keystrokes per field
+    typing = False
+
+    def __init__(self, driver):
+        """Initialize page"""
+        self.driver = driver
+        self.wait = WebDriverWait(driver, self.TIMEOUT, poll_frequency=self.POLL_INTERVAL)
+        # Elements found on the current document, keyed by locator
+        self._elements = {}
+
+    @property
+    def current_url(self):
+        """URL currently shown in the browser"""
+        return self.driver.current_url
+
+    def find(self, locator, timeout=None):
+        """Element at locator, looked up once per document"""
+        element = self._elements.get(locator)
+        if element is None:
+            element = self.wait_until(EC.presence_of_element_located(locator), timeout)
+            self._elements[locator] = element
+        return element
+
+    def with_element(self, locator, action, timeout=None):
+        """Run action on the cached element, looking it up again if it went stale"""
+        try:
+            return action(self.find(locator, timeout))
+        except StaleElementReferenceException:
+            self.forget_elements()
+            return action(self.find(locator, timeout))
+
+    def type_into(self, locator, value, timeout=None):
+        """Clear the field at locator and type value"""
+        def _type(element):
+            element.clear()
+            element.send_keys(value)
+        self.with_element(locator, _type, timeout)
+
+    def record_navigation(self):
+        """Record the Navigation Timing of the document just loaded"""
+        try:
+            navigation_timing.record_navigation(self.driver)
+        except WebDriverException as e:
+            print(f"Warning: Could not read Navigation Timing: {e}")
+
+    def forget_elements(self):
+        """Drop cached elements; call whenever the document is replaced"""
+        self._elements.clear()
+
+    def wait_until(self, condition, timeout=None, poll=None):
+        """Wait for condition with a per-call timeout and poll interval"""
+        if timeout is None and poll is None:
+            return self.wait.until(condition)
+        wait = WebDriverWait(
+            self.driver,
+            self.TIMEOUT if timeout is None else timeout,
+            poll_frequency=self.POLL_INTERVAL if poll is None else poll
+        )
+        return wait.until(condition)
+
+    def fill_form(self, fields, submit=False, typing=None,
+                  url=None, error=None, stale=True, timeout=None, poll=None):
+        """
+        Set several fields and optionally submit the form
+
+        fields: list of (locator, value) pairs, filled in order
+        typing: True to clear and send_keys each field, False to set every
+        value and fire input/change events in a single execute_script call;
+        defaults to the page's typing attribute.
+
+        With submit=True the wait keywords work like submit_and_wait_for;
+        in script mode the submit click happens in the same call.
+        """
+        typing = self.typing if typing is None else typing
+        if typing:
+            for locator, value in fields:
+                self.type_into(locator, value, timeout)
+            if submit:
+                return self.submit_and_wait_for(url=url, error=error, stale=stale, timeout=timeout, poll=poll)
+            return None
+
+        result = self.driver.execute_script(
+            FILL_FORM_SCRIPT,
+            [[_css_selector(locator), value] for locator, value in fields],
+            _css_selector(self.SUBMIT_BUTTON) if submit else None
+        )
+        if result.get("missing"):
+            raise NoSuchElementException(f"Unable to locate element: {result['missing']}")
+        if submit:
+            self.forget_elements()
+            old_form = result.get("form") if stale else None
+            return self.wait_for_navigation(old_form, url=url, error=error, timeout=timeout, poll=poll)
+        return None
+
+    def submit_and_wait_for(self, url=None, error=None, stale=True, timeout=None, poll=None):
+        """
+        Click the submit button and wait until the response page is shown
+
+        url: substring the new URL must contain (e.g. "index.php")
+        error: True to wait for the page's error alert, or a locator
+        stale: wait for the old form to go stale, i.e. the page reloaded
+
+        When both url and error are given, whichever shows up first wins.
+        Returns "url", "error" or "loaded"; raises TimeoutException otherwise.
+        """
+        return self.click_and_wait_for(
+            self.SUBMIT_BUTTON, url=url, error=error, stale=stale, timeout=timeout, poll=poll
+        )
+
+    def click_and_wait_for(self, locator, url=None, error=None, stale=True, timeout=None, poll=None):
+        """Click the element at locator and wait like submit_and_wait_for"""
+        old_form = self.driver.find_element(*self.FORM) if stale else None
+        element = self.wait_until(EC.element_to_be_clickable(locator), timeout, poll)
+        element.click()
+        self.forget_elements()
+        return self.wait_for_navigation(old_form, url=url, error=error, timeout=timeout, poll=poll)
+
+    def wait_for_navigation(self, old_element=None, url=None, error=None, timeout=None, poll=None):
+        """Wait until old_element is stale and the url/error condition holds"""
+        error_locator = self.ERROR_MESSAGE if error is True else error
+
+        def _arrived(driver):
+            if old_element is not None and not _is_stale(old_element):
+                return False
+            if url is not None and url in driver.current_url:
+                return "url"
+            if error_locator:
+                visible = [e for e in driver.find_elements(*error_locator) if _is_displayed(e)]
+                if visible:
+                    return "error"
+            if url is None and not error_locator:
+                ready = driver.execute_script("return document.readyState")
+                return "loaded" if ready != "loading" else False
+            return False
+
+        arrived = self.wait_until(_arrived, timeout, poll)
+        self.record_navigation()
+        return arrived
+
+
+# Sets each field like a user would leave it (value + input/change events),
+# then clicks submit so the browser posts the form, including name="submit".
+FILL_FORM_SCRIPT = """
+var fields = arguments[0], submitSelector = arguments[1];
+for (var i = 0; i < fields.length; i++) {
+    var element = document.querySelector(fields[i][0]);
+    if (!element) { return {missing: fields[i][0]}; }
+    element.value = fields[i][1];
+    element.dispatchEvent(new Event('input', {bubbles: true}));
+    element.dispatchEvent(new Event('change', {bubbles: true}));
+}
+if (!submitSelector) { return {}; }
+var button = document.querySelector(submitSelector);
+if (!button) { return {missing: submitSelector}; }
+var form = button.form;
+button.click();
+return {form: form};
+"""
+
+
+def _css_selector(locator):
+    """Translate an (By, value) locator into a CSS selector for querySelector"""
+    by, value = locator
+    if by == By.CSS_SELECTOR:
+        return value
+    if by == By.ID:
+        return f"[id='{value}']"
+    if by == By.NAME:
+        return f"[name='{value}']"
+    raise ValueError(f"Locator {locator} cannot be used for batched form filling")
+
+
+def _is_stale(element):
+    """Return True once element is detached from the current document"""
+    try:
+        element.is_enabled()
+        return False
+    except StaleElementReferenceException:
+        return True
+
+
+def _is_displayed(element):
+    """Visibility check that treats a vanished element as hidden"""
+    try:
+        return element.is_displayed()
+    except WebDriverException:
+        return False
@@ -0,0 +1,232 @@
+"""
+HTTP Page Object backend - drive login.php/register.php without a browser
+"""
+import re
+from html.parser import HTMLParser
+
+import requests
+from requests.adapters import HTTPAdapter
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+
+from pages.navigation_timing import record_response
+
+CLASS_SELECTOR = re.compile(r"^\.([\w-]+)$")
+
+
+def create_http_adapter(pool_size=10):
+    """Create a keep-alive connection pool to share between sessions"""
+    return HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+
+
+class _ClassTextParser(HTMLParser):
+    """Collect the text of every element carrying a CSS class"""
+
+    VOID_TAGS = {"area", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+
+    def __init__(self, css_class):
+        super().__init__()
+        self.css_class = css_class
+        self.texts = []
+        self._depth = 0
+        self._buffer = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.VOID_TAGS:
+            return
+        if self._depth:
+            self._depth += 1
+            return
+        classes = (dict(attrs).get("class") or "").split()
+        if self.css_class in classes:
+            self._depth = 1
+            self._buffer = []
+
+    def handle_endtag(self, tag):
+        if tag in self.VOID_TAGS or not self._depth:
+            return
+        self._depth -= 1
+        if not self._depth:
+            self.texts.append(" ".join("".join(self._buffer).split()))
+
+    def handle_data(self, data):
+        if self._depth:
+            self._buffer.append(data)
+
+
+def find_texts_by_class(html, css_class):
+    """Return the text of all elements with css_class, in document order"""
+    parser = _ClassTextParser(css_class)
+    parser.feed(html)
+    parser.close()
+    return parser.texts
+
+
+class HttpPage:
+    """Shared behaviour for HTTP page objects"""
+
+    PATH = ""
+    FIELDS = ()
+    ERROR_CLASS = "alert-danger"
+    VALIDATE_CLASS = "text-danger"
+    TIMEOUT = 10
+
+    def __init__(self, session=None, base_url="http://localhost/quiz", adapter=None):
+        """Initialize page with an optional shared session or pooled adapter"""
+        if session is None:
+            session = requests.Session()
+            if adapter is not None:
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+        self.session = session
+        self.base_url = base_url
+        self.response = None
+        self.form = {}
+
+    @property
+    def url(self):
+        """Absolute URL of the page"""
+        return f"{self.base_url}/{self.PATH}"
+
+    @property
+    def current_url(self):
+        """URL of the last response, after redirects"""
+        return self.response.url if self.response is not None else None
+
+    @property
+    def page_source(self):
+        """HTML of the last response"""
+        return self.response.text if self.response is not None else ""
+
+    def navigate_to(self, base_url=None):
+        """Load the page and reset the form"""
+        if base_url is not None:
+            self.base_url = base_url
+        self.form = {}
+        self.response = self.session.get(self.url, timeout=self.TIMEOUT)
+        record_response(self.response)
+
+    def submit_and_wait_for(self, url=None, error=None, **wait):
+        """
+        POST the form and report the outcome like the Selenium page objects
+
+        The response is already final, so nothing is waited for: returns
+        "url" when the final URL contains url, "error" when the page shows
+        the error alert, "loaded" when neither was asked for, and raises
+        TimeoutException when the asked-for outcome is not the one reached.
+        """
+        # Browsers post every field of the form, empty ones included
+        data = {field: "" for field in self.FIELDS}
+        data.update(self.form)
+        data["submit"] = ""
+        self.response = self.session.post(self.url, data=data, timeout=self.TIMEOUT)
+        record_response(self.response)
+
+        error_class = self._error_class(error)
+        if url is not None and url in self.current_url:
+            return "url"
+        if error_class and find_texts_by_class(self.page_source, error_class):
+            return "error"
+        if url is None and not error_class:
+            return "loaded"
+        expected = []
+        if url is not None:
+            expected.append(f"url {url!r}")
+        if error_class:
+            expected.append(f"error .{error_class}")
+        raise TimeoutException(
+            f"{self.PATH} answered with {self.current_url} without reaching {' or '.join(expected)}"
+        )
+
+    def _error_class(self, error):
+        """CSS class an error=True/locator argument stands for, or None"""
+        if not error:
+            return None
+        if error is True:
+            return self.ERROR_CLASS
+        by, value = error
+        if by == By.CLASS_NAME:
+            return value
+        match = CLASS_SELECTOR.match(value) if by == By.CSS_SELECTOR else None
+        if match:
+            return match.group(1)
+        raise ValueError(f"HTTP pages can only wait for an error by CSS class, got {error!r}")
+
+    def get_error_message(self, timeout=None):
+        """Get error message if displayed"""
+        texts = find_texts_by_class(self.page_source, self.ERROR_CLASS)
+        return texts[0] if texts else None
+
+    def get_validate_message(self):
+        """Get validation message if displayed"""
+        texts = find_texts_by_class(self.page_source, self.VALIDATE_CLASS)
+        return texts[0] if texts else None
+
+    def wait_for_error_message(self, timeout=None):
+        """Check whether an error message is displayed"""
+        return self.get_error_message() is not None
+
+
+class HttpLoginPage(HttpPage):
+    """HTTP Page Object for Login Page"""
+
+    PATH = "login.php"
+    FIELDS = ("username", "password")
+
+    def enter_username(self, username):
+        """Enter username"""
+        self.form["username"] = username
+
+    def enter_password(self, password):
+        """Enter password"""
+        self.form["password"] = password
+
+    def click_sign_in_button(self):
+        """Submit the login form"""
+        self.submit_and_wait_for()
+
+    def login(self, username, password, typing=None, **wait):
+        """Perform login action"""
+        self.enter_username(username)
+        self.enter_password(password)
+        return self.submit_and_wait_for(**wait)
+
+
+class HttpRegisterPage(HttpPage):
+    """HTTP Page Object for Register Page"""
+
+    PATH = "register.php"
+    FIELDS = ("name", "email", "username", "password", "repassword")
+
+    def enter_name(self, name):
+        """Enter name"""
+        self.form["name"] = name
+
+    def enter_email(self, email):
+        """Enter email"""
+        self.form["email"] = email
+
+    def enter_username(self, username):
+        """Enter username"""
+        self.form["username"] = username
+
+    def enter_password(self, password):
+        """Enter password"""
+        self.form["password"] = password
+
+    def enter_repassword(self, repassword):
+        """Enter confirm password"""
+        self.form["repassword"] = repassword
+
+    def click_register_button(self):
+        """Submit the register form"""
+        self.submit_and_wait_for()
+
+    def register(self, name, email, username, password, repassword, typing=None, **wait):
+        """Perform register action"""
+        self.enter_name(name)
+        self.enter_email(email)
+        self.enter_username(username)
+        self.enter_password(password)
+        self.enter_repassword(repassword)
+        return self.submit_and_wait_for(**wait)
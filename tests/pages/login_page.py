@@ -1,12 +1,14 @@
 """
 Login Page Object Model
 """
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from pages.base_page import BasePage
 
-class LoginPage:
+
+class LoginPage(BasePage):
     """Page Object for Login Page"""
 
     # Locators
@@ -17,55 +19,53 @@ class LoginPage:
     REGISTER_LINK = (By.CSS_SELECTOR, "a[href='register.php']")
     SIGN_IN_TITLE = (By.CSS_SELECTOR, "h4")
 
-    def __init__(self, driver):
-        """Initialize Login Page"""
-        self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
-
     def navigate_to(self, base_url="http://localhost/quiz"):
         """Navigate to login page"""
         self.driver.get(f"{base_url}/login.php")
+        self.forget_elements()
+        self.record_navigation()
 
     def enter_username(self, username):
         """Enter username"""
-        username_input = self.wait.until(EC.presence_of_element_located(self.USERNAME_INPUT))
-        username_input.clear()
-        username_input.send_keys(username)
+        self.type_into(self.USERNAME_INPUT, username)
 
     def enter_password(self, password):
         """Enter password"""
-        password_input = self.wait.until(EC.presence_of_element_located(self.PASSWORD_INPUT))
-        password_input.clear()
-        password_input.send_keys(password)
+        self.type_into(self.PASSWORD_INPUT, password)
 
     def click_sign_in_button(self):
         """Click Sign In button"""
         submit_button = self.wait.until(EC.element_to_be_clickable(self.SUBMIT_BUTTON))
         submit_button.click()
+        self.forget_elements()
 
-    def get_error_message(self):
+    def get_error_message(self, timeout=5):
         """Get error message if displayed"""
         try:
-            error_element = self.wait.until(EC.visibility_of_element_located(self.ERROR_MESSAGE), timeout=5)
+            error_element = self.wait_until(EC.visibility_of_element_located(self.ERROR_MESSAGE), timeout)
             return error_element.text
-        except:
+        except TimeoutException:
             return None
 
     def get_page_title(self):
         """Get page title"""
-        title_element = self.wait.until(EC.presence_of_element_located(self.SIGN_IN_TITLE))
-        return title_element.text
+        return self.with_element(self.SIGN_IN_TITLE, lambda element: element.text)
+
+    def click_register_link(self, timeout=None):
+        """Click Register link and wait for register.php to load"""
+        return self.click_and_wait_for(self.REGISTER_LINK, url="register.php", timeout=timeout)
 
-    def click_register_link(self):
-        """Click Register link"""
-        register_link = self.wait.until(EC.element_to_be_clickable(self.REGISTER_LINK))
-        register_link.click()
+    def login(self, username, password, typing=None, **wait):
+        """Perform login action and wait for the response page
 
-    def login(self, username, password):
-        """Perform login action"""
-        self.enter_username(username)
-        self.enter_password(password)
-        self.click_sign_in_button()
+        typing=True types into each field instead of the batched fill.
+        Keyword arguments are passed on like submit_and_wait_for, e.g.
+        login(username, password, url="index.php").
+        """
+        return self.fill_form(
+            [(self.USERNAME_INPUT, username), (self.PASSWORD_INPUT, password)],
+            submit=True, typing=typing, **wait
+        )
 
     def is_page_title_correct(self):
         """Verify page title is 'Sign-In'"""
@@ -73,18 +73,16 @@ class LoginPage:
 
     def get_username_input_value(self):
         """Get username input value"""
-        username_input = self.driver.find_element(*self.USERNAME_INPUT)
-        return username_input.get_attribute("value")
+        return self.with_element(self.USERNAME_INPUT, lambda element: element.get_attribute("value"))
 
     def get_password_input_value(self):
         """Get password input value"""
-        password_input = self.driver.find_element(*self.PASSWORD_INPUT)
-        return password_input.get_attribute("value")
+        return self.with_element(self.PASSWORD_INPUT, lambda element: element.get_attribute("value"))
 
     def wait_for_error_message(self, timeout=5):
         """Wait for error message to appear"""
         try:
-            self.wait.until(EC.visibility_of_element_located(self.ERROR_MESSAGE), timeout=timeout)
+            self.wait_until(EC.visibility_of_element_located(self.ERROR_MESSAGE), timeout)
             return True
-        except:
+        except TimeoutException:
             return False
@@ -0,0 +1,153 @@
+"""
+Navigation Timing - what every page load of login.php/register.php cost
+
+Page objects call record_navigation (browser) or record_response (HTTP)
+after each navigate_to and form submit. The entries go to the recorder of
+the running test, if any, and can be checked against budgets such as
+"login.php ttfb p95 < 50 ms".
+"""
+import re
+from urllib.parse import urlsplit
+
+from perf.stats import percentile
+
+METRICS = ("ttfb_ms", "dom_content_loaded_ms", "load_ms", "bytes", "requests")
+
+# Navigation entry of the current document plus its resources. timeOrigin
+# identifies the document, so a second reading of the same load (e.g. once
+# the load event fired) replaces the first.
+NAVIGATION_TIMING_SCRIPT = """
+var nav = performance.getEntriesByType('navigation')[0];
+if (!nav) { return null; }
+var resources = performance.getEntriesByType('resource');
+var bytes = nav.transferSize || nav.encodedBodySize || 0;
+for (var i = 0; i < resources.length; i++) {
+    bytes += resources[i].transferSize || resources[i].encodedBodySize || 0;
+}
+return {
+    document: performance.timeOrigin,
+    url: nav.name,
+    ttfb_ms: nav.responseStart - nav.startTime,
+    dom_content_loaded_ms: nav.domContentLoadedEventEnd > 0 ? nav.domContentLoadedEventEnd - nav.startTime : null,
+    load_ms: nav.loadEventEnd > 0 ? nav.loadEventEnd - nav.startTime : null,
+    bytes: bytes,
+    requests: 1 + resources.length
+};
+"""
+
+BUDGET_PATTERN = re.compile(r"^\s*([^:\s]+):(\w+):p(\d+(?:\.\d+)?)\s*<\s*(\d+(?:\.\d+)?)\s*$")
+
+_active = None
+
+
+def page_of(url):
+    """'http://localhost/quiz/login.php?x=1' -> 'login.php'"""
+    return urlsplit(url or "").path.rsplit("/", 1)[-1]
+
+
+class NavigationTimings:
+    """Navigation entries of one test"""
+
+    def __init__(self):
+        """Initialize empty recorder"""
+        self.entries = []
+
+    def record(self, entry):
+        """Add one entry; a later reading of the last document replaces it"""
+        entry["page"] = page_of(entry.get("url"))
+        if self.entries and entry.get("document") is not None \
+                and self.entries[-1].get("document") == entry["document"]:
+            self.entries[-1] = entry
+            return
+        self.entries.append(entry)
+
+    def values(self, page, metric):
+        """Sorted, known values of metric for page"""
+        return sorted(
+            entry[metric] for entry in self.entries
+            if entry["page"] == page and entry.get(metric) is not None
+        )
+
+    def percentile(self, page, metric, pct=95):
+        """Nearest-rank percentile of metric for page, None without samples"""
+        values = self.values(page, metric)
+        return percentile(values, pct) if values else None
+
+    def check_budget(self, page, metric, limit, pct=95):
+        """Violation message, or None when the budget holds (or has no samples)"""
+        value = self.percentile(page, metric, pct)
+        if value is None or value < limit:
+            return None
+        return f"{page} {metric} p{pct:g} = {value:.1f}, budget < {limit:g}"
+
+    def summary(self):
+        """Per page count and p50/p95 of each metric"""
+        result = {}
+        for page in sorted({entry["page"] for entry in self.entries}):
+            row = {'count': sum(1 for entry in self.entries if entry["page"] == page)}
+            for metric in METRICS:
+                row[f"{metric}_p50"] = self.percentile(page, metric, 50)
+                row[f"{metric}_p95"] = self.percentile(page, metric, 95)
+            result[page] = row
+        return result
+
+
+def parse_budgets(text):
+    """'login.php:ttfb_ms:p95<50,...' -> [(page, metric, pct, limit), ...]"""
+    budgets = []
+    for part in text.split(","):
+        if not part.strip():
+            continue
+        match = BUDGET_PATTERN.match(part)
+        if match is None or match.group(2) not in METRICS:
+            raise ValueError(f"Invalid budget {part.strip()!r}, expected page:metric:pNN<limit "
+                             f"with metric one of {', '.join(METRICS)}")
+        page, metric, pct, limit = match.groups()
+        budgets.append((page, metric, float(pct), float(limit)))
+    return budgets
+
+
+def current():
+    """NavigationTimings of the running test, or None"""
+    return _active
+
+
+def start():
+    """Begin recording navigations into a new NavigationTimings"""
+    global _active
+    _active = NavigationTimings()
+    return _active
+
+
+def stop():
+    """Stop recording; returns the finished NavigationTimings"""
+    global _active
+    timings, _active = _active, None
+    return timings
+
+
+def record_navigation(driver):
+    """Record the current document's Navigation Timing, if a test is recording"""
+    if _active is None:
+        return None
+    entry = driver.execute_script(NAVIGATION_TIMING_SCRIPT)
+    if entry:
+        _active.record(entry)
+    return entry
+
+
+def record_response(response):
+    """Record a requests response (HTTP page objects): TTFB is the time to headers"""
+    if _active is None or response is None:
+        return None
+    entry = {
+        'document': None,
+        'url': response.url,
+        'ttfb_ms': response.elapsed.total_seconds() * 1000,
+        'dom_content_loaded_ms': None,
+        'load_ms': None,
+        'bytes': len(response.content),
+        'requests': 1,
+    }
+    _active.record(entry)
+    return entry
@@ -1,12 +1,14 @@
 """
 Register Page Object Model
 """
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from pages.base_page import BasePage
 
-class RegisterPage:
+
+class RegisterPage(BasePage):
     """Page Object for Register Page"""
 
     # Locators
@@ -21,56 +23,44 @@ class RegisterPage:
     LOGIN_LINK = (By.CSS_SELECTOR, "a[href='login.php']")
     SIGN_UP_TITLE = (By.CSS_SELECTOR, "h4")
 
-    def __init__(self, driver):
-        """Initialize Register Page"""
-        self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
-
     def navigate_to(self, base_url="http://localhost/quiz"):
         """Navigate to register page"""
         self.driver.get(f"{base_url}/register.php")
+        self.forget_elements()
+        self.record_navigation()
 
     def enter_name(self, name):
         """Enter name"""
-        name_input = self.wait.until(EC.presence_of_element_located(self.NAME_INPUT))
-        name_input.clear()
-        name_input.send_keys(name)
+        self.type_into(self.NAME_INPUT, name)
 
     def enter_email(self, email):
         """Enter email"""
-        email_input = self.wait.until(EC.presence_of_element_located(self.EMAIL_INPUT))
-        email_input.clear()
-        email_input.send_keys(email)
+        self.type_into(self.EMAIL_INPUT, email)
 
     def enter_username(self, username):
         """Enter username"""
-        username_input = self.wait.until(EC.presence_of_element_located(self.USERNAME_INPUT))
-        username_input.clear()
-        username_input.send_keys(username)
+        self.type_into(self.USERNAME_INPUT, username)
 
     def enter_password(self, password):
         """Enter password"""
-        password_input = self.wait.until(EC.presence_of_element_located(self.PASSWORD_INPUT))
-        password_input.clear()
-        password_input.send_keys(password)
+        self.type_into(self.PASSWORD_INPUT, password)
 
     def enter_repassword(self, repassword):
         """Enter confirm password"""
-        repassword_input = self.wait.until(EC.presence_of_element_located(self.REPASSWORD_INPUT))
-        repassword_input.clear()
-        repassword_input.send_keys(repassword)
+        self.type_into(self.REPASSWORD_INPUT, repassword)
 
     def click_register_button(self):
         """Click Register button"""
         submit_button = self.wait.until(EC.element_to_be_clickable(self.SUBMIT_BUTTON))
         submit_button.click()
+        self.forget_elements()
 
-    def get_error_message(self):
+    def get_error_message(self, timeout=5):
         """Get error message if displayed"""
         try:
-            error_element = self.wait.until(EC.visibility_of_element_located(self.ERROR_MESSAGE), timeout=5)
+            error_element = self.wait_until(EC.visibility_of_element_located(self.ERROR_MESSAGE), timeout)
             return error_element.text
-        except:
+        except TimeoutException:
             return None
 
     def get_validate_message(self):
@@ -85,22 +75,25 @@ class RegisterPage:
 
     def get_page_title(self):
         """Get page title"""
-        title_element = self.wait.until(EC.presence_of_element_located(self.SIGN_UP_TITLE))
-        return title_element.text
-
-    def click_login_link(self):
-        """Click Login link"""
-        login_link = self.wait.until(EC.element_to_be_clickable(self.LOGIN_LINK))
-        login_link.click()
-
-    def register(self, name, email, username, password, repassword):
-        """Perform register action"""
-        self.enter_name(name)
-        self.enter_email(email)
-        self.enter_username(username)
-        self.enter_password(password)
-        self.enter_repassword(repassword)
-        self.click_register_button()
+        return self.with_element(self.SIGN_UP_TITLE, lambda element: element.text)
+
+    def click_login_link(self, timeout=None):
+        """Click Login link and wait for login.php to load"""
+        return self.click_and_wait_for(self.LOGIN_LINK, url="login.php", timeout=timeout)
+
+    def register(self, name, email, username, password, repassword, typing=None, **wait):
+        """Perform register action and wait for the response page
+
+        typing=True types into each field instead of the batched fill.
+        Keyword arguments are passed on like submit_and_wait_for.
+        """
+        return self.fill_form([
+            (self.NAME_INPUT, name),
+            (self.EMAIL_INPUT, email),
+            (self.USERNAME_INPUT, username),
+            (self.PASSWORD_INPUT, password),
+            (self.REPASSWORD_INPUT, repassword),
+        ], submit=True, typing=typing, **wait)
 
     def is_page_title_correct(self):
         """Verify page title is 'Sign-Up'"""
@@ -109,7 +102,7 @@ class RegisterPage:
     def wait_for_error_message(self, timeout=5):
         """Wait for error message to appear"""
         try:
-            self.wait.until(EC.visibility_of_element_located(self.ERROR_MESSAGE), timeout=timeout)
+            self.wait_until(EC.visibility_of_element_located(self.ERROR_MESSAGE), timeout)
             return True
-        except:
+        except TimeoutException:
             return False
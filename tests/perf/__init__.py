@@ -0,0 +1 @@
+# Performance tools package
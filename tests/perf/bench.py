@@ -0,0 +1,117 @@
+"""
+Microbenchmarks with a stored baseline and regression detection
+
+Samples are compared against the baseline with a one-sided Mann-Whitney U
+test (normal approximation), which does not assume normally distributed
+latencies. A regression needs both statistical significance and a minimum
+slowdown of the median, so noise on a fast box is not flagged.
+"""
+import json
+import math
+import statistics
+import time
+from pathlib import Path
+
+
+def measure(fn, iterations=30, warmup=3, setup=None):
+    """Time fn over iterations runs after warmup runs; setup is not timed"""
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        fn()
+
+    samples = []
+    for _ in range(iterations):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def describe(samples):
+    """Summary statistics in milliseconds"""
+    ordered = sorted(samples)
+    return {
+        'n': len(ordered),
+        'min_ms': ordered[0] * 1000,
+        'median_ms': statistics.median(ordered) * 1000,
+        'mean_ms': statistics.fmean(ordered) * 1000,
+        'stdev_ms': (statistics.stdev(ordered) if len(ordered) > 1 else 0.0) * 1000,
+    }
+
+
+def mann_whitney_greater(current, baseline):
+    """
+    One-sided p-value that current is stochastically larger than baseline
+
+    Uses average ranks for ties and the normal approximation with tie
+    correction, which is accurate enough from about 10 samples per side.
+    """
+    n1, n2 = len(current), len(baseline)
+    if not n1 or not n2:
+        return 1.0
+    combined = sorted([(value, 0) for value in current] + [(value, 1) for value in baseline])
+
+    ranks = [0.0] * len(combined)
+    tie_term = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        average = (i + j) / 2.0 + 1
+        for k in range(i, j + 1):
+            ranks[k] = average
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2.0
+    n = n1 + n2
+    variance = n1 * n2 / 12.0 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2.0 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare(current, baseline, alpha=0.01, min_slowdown=0.05):
+    """Compare samples with a baseline and flag significant regressions"""
+    current_median = statistics.median(current)
+    baseline_median = statistics.median(baseline)
+    slowdown = current_median / baseline_median - 1 if baseline_median else 0.0
+    p_value = mann_whitney_greater(current, baseline)
+    return {
+        'p_value': p_value,
+        'slowdown': slowdown,
+        'regression': p_value < alpha and slowdown > min_slowdown,
+    }
+
+
+class BaselineStore:
+    """One JSON file of raw samples per benchmark, so xdist workers never clash"""
+
+    def __init__(self, directory=".benchmarks"):
+        """Initialize store rooted at directory"""
+        self.directory = Path(directory)
+
+    def _path(self, name):
+        safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in name)
+        return self.directory / f"{safe}.json"
+
+    def load(self, name):
+        """Return the stored samples for name, or None"""
+        path = self._path(name)
+        if not path.exists():
+            return None
+        with open(path) as f:
+            return json.load(f)['samples']
+
+    def save(self, name, samples):
+        """Store samples for name as the new baseline"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self._path(name), 'w') as f:
+            json.dump({'name': name, 'summary': describe(samples), 'samples': samples}, f, indent=2)
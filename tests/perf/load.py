@@ -0,0 +1,172 @@
+"""
+Closed-loop load harness for login.php and register.php
+
+Each virtual user runs the register -> login flow back to back: it only
+starts the next request once the previous one returned.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pages.http_backend import HttpLoginPage, HttpRegisterPage, create_http_adapter
+from perf.stats import percentile
+from test_helpers import TestDataGenerator
+
+
+class LatencyStats:
+    """Thread-safe latency and outcome recorder, grouped by endpoint"""
+
+    def __init__(self):
+        """Initialize empty stats"""
+        self._samples = {}
+        self._errors = {}
+        self._lock = threading.Lock()
+        self.started = None
+        self.finished = None
+
+    def start(self):
+        """Mark the start of the measured window"""
+        self.started = time.perf_counter()
+
+    def stop(self):
+        """Mark the end of the measured window"""
+        self.finished = time.perf_counter()
+
+    def record(self, endpoint, seconds, ok=True):
+        """Record one request"""
+        with self._lock:
+            self._samples.setdefault(endpoint, []).append(seconds)
+            if not ok:
+                self._errors[endpoint] = self._errors.get(endpoint, 0) + 1
+
+    def samples(self, endpoint=None):
+        """Sorted latencies of one endpoint, or of all endpoints"""
+        with self._lock:
+            if endpoint is not None:
+                return sorted(self._samples.get(endpoint, []))
+            return sorted(value for values in self._samples.values() for value in values)
+
+    @property
+    def duration(self):
+        """Length of the measured window in seconds"""
+        if self.started is None:
+            return 0.0
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return end - self.started
+
+    def summary(self):
+        """Per-endpoint count, errors, throughput and latency percentiles (ms)"""
+        with self._lock:
+            samples = {endpoint: sorted(values) for endpoint, values in self._samples.items()}
+            errors = dict(self._errors)
+
+        duration = self.duration or 1e-9
+        result = {}
+        for endpoint, values in samples.items():
+            result[endpoint] = {
+                'count': len(values),
+                'errors': errors.get(endpoint, 0),
+                'error_rate': errors.get(endpoint, 0) / len(values),
+                'throughput_rps': len(values) / duration,
+                'p50_ms': percentile(values, 50) * 1000,
+                'p95_ms': percentile(values, 95) * 1000,
+                'p99_ms': percentile(values, 99) * 1000,
+                'max_ms': values[-1] * 1000,
+            }
+        return result
+
+
+def check_slos(summary, p95_ms=None, p99_ms=None, max_error_rate=None):
+    """Return a list of human readable SLO violations"""
+    violations = []
+    for endpoint, stats in sorted(summary.items()):
+        if p95_ms is not None and stats['p95_ms'] > p95_ms:
+            violations.append(f"{endpoint}: p95 {stats['p95_ms']:.1f} ms > {p95_ms} ms")
+        if p99_ms is not None and stats['p99_ms'] > p99_ms:
+            violations.append(f"{endpoint}: p99 {stats['p99_ms']:.1f} ms > {p99_ms} ms")
+        if max_error_rate is not None and stats['error_rate'] > max_error_rate:
+            violations.append(
+                f"{endpoint}: error rate {stats['error_rate']:.2%} > {max_error_rate:.2%}"
+            )
+    return violations
+
+
+def format_summary(summary, duration=None):
+    """Render the summary as a plain text table"""
+    lines = []
+    if duration is not None:
+        lines.append(f"Duration: {duration:.2f} s")
+    lines.append(
+        f"{'Endpoint':<16}{'Count':>7}{'Errors':>8}{'RPS':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    )
+    for endpoint, stats in sorted(summary.items()):
+        lines.append(
+            f"{endpoint:<16}{stats['count']:>7}{stats['errors']:>8}{stats['throughput_rps']:>9.1f}"
+            f"{stats['p50_ms']:>9.1f}{stats['p95_ms']:>9.1f}{stats['p99_ms']:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+class AuthFlowUser:
+    """One virtual user running register -> login with the HTTP page objects"""
+
+    PASSWORD = 'Load@123'
+
+    def __init__(self, base_url, adapter, stats):
+        """Initialize virtual user"""
+        self.base_url = base_url
+        self.adapter = adapter
+        self.stats = stats
+
+    def run_once(self):
+        """Register a fresh user, then log in with it from a new session"""
+        username = TestDataGenerator.generate_username('load')
+        email = TestDataGenerator.generate_email('load')
+
+        register_page = HttpRegisterPage(base_url=self.base_url, adapter=self.adapter)
+        registered = self._timed('register.php', lambda: register_page.register(
+            'Load User', email, username, self.PASSWORD, self.PASSWORD
+        ), register_page)
+
+        login_page = HttpLoginPage(base_url=self.base_url, adapter=self.adapter)
+        if registered:
+            self._timed('login.php', lambda: login_page.login(username, self.PASSWORD), login_page)
+
+    def _timed(self, endpoint, action, page):
+        """Run action, record its latency and whether the app accepted it"""
+        start = time.perf_counter()
+        try:
+            action()
+        except Exception:  # network errors count as failed requests
+            self.stats.record(endpoint, time.perf_counter() - start, ok=False)
+            return False
+        elapsed = time.perf_counter() - start
+        ok = is_success(page)
+        self.stats.record(endpoint, elapsed, ok)
+        return ok
+
+
+def is_success(page):
+    """Register and login succeed when the app redirects to index.php"""
+    return (page.current_url is not None
+            and 'index.php' in page.current_url
+            and page.get_error_message() is None)
+
+
+def run_closed_loop(base_url, users=10, iterations=5):
+    """Drive users concurrent virtual users for iterations flows each"""
+    stats = LatencyStats()
+    adapter = create_http_adapter(pool_size=users)
+
+    def _virtual_user():
+        user = AuthFlowUser(base_url, adapter, stats)
+        for _ in range(iterations):
+            user.run_once()
+
+    stats.start()
+    with ThreadPoolExecutor(max_workers=users) as executor:
+        for future in [executor.submit(_virtual_user) for _ in range(users)]:
+            future.result()
+    stats.stop()
+    adapter.close()
+    return stats
@@ -0,0 +1,202 @@
+"""
+Open-loop arrival-rate load generator for login.php and register.php
+
+Requests are issued on a fixed schedule, independent of how fast the app
+answers, so queueing delay in php -S and MySQL shows up in the latency.
+Latency is measured from the scheduled arrival time, not from the moment
+the request actually left the client.
+"""
+import asyncio
+import itertools
+from urllib.parse import urlencode, urlsplit
+
+from pages.http_backend import HttpLoginPage, HttpRegisterPage, find_texts_by_class
+from perf.load import LatencyStats
+from perf.stats import percentile
+from test_helpers import TestDataGenerator
+
+
+def parse_response(raw):
+    """Split a raw HTTP/1.x response into (status, headers, body)"""
+    head, _, body = raw.partition(b"\r\n\r\n")
+    lines = head.decode("iso-8859-1").split("\r\n")
+    status = int(lines[0].split()[1])
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return status, headers, body.decode("utf-8", errors="replace")
+
+
+def is_success(status, headers, body):
+    """Same rule as the page objects: redirect to index.php, no error alert"""
+    redirected = status in (301, 302, 303) and "index.php" in headers.get("location", "")
+    return redirected and not find_texts_by_class(body, HttpLoginPage.ERROR_CLASS)
+
+
+def linear_ramp(start, stop, steps):
+    """Arrival rates from start to stop (requests/second) in equal steps"""
+    if steps < 2:
+        return [float(start)]
+    step = (stop - start) / (steps - 1)
+    return [start + i * step for i in range(steps)]
+
+
+def find_knee(points, key="p95_ms"):
+    """
+    Return the offered rate at the knee of the rate-vs-latency curve
+
+    Uses the Kneedle method for a convex, increasing curve: after scaling
+    both axes to [0, 1], the knee is the point furthest below the straight
+    line between the first and the last point.
+    """
+    points = sorted(points, key=lambda p: p["rate"])
+    if len(points) < 3:
+        return None
+    xs = [p["rate"] for p in points]
+    ys = [p[key] for p in points]
+    x_span = (xs[-1] - xs[0]) or 1.0
+    y_span = (max(ys) - min(ys)) or 1.0
+    y_min = min(ys)
+    distances = [(x - xs[0]) / x_span - (y - y_min) / y_span for x, y in zip(xs, ys)]
+    best = max(range(len(points)), key=lambda i: distances[i])
+    if distances[best] <= 0:
+        return None
+    return points[best]["rate"]
+
+
+class OpenLoopGenerator:
+    """Issue login/register requests at a fixed arrival rate with asyncio"""
+
+    def __init__(self, base_url, login_username, login_password, login_share=0.5, timeout=10):
+        """Initialize generator for the app at base_url"""
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.prefix = parts.path.rstrip("/")
+        self.login_username = login_username
+        self.login_password = login_password
+        self.login_share = login_share
+        self.timeout = timeout
+
+    def _form(self, page_class, values):
+        """Encode a form the way a browser posts it"""
+        data = {field: "" for field in page_class.FIELDS}
+        data.update(values)
+        data["submit"] = ""
+        return urlencode(data)
+
+    def _request(self, endpoint):
+        """Build the raw POST request for endpoint"""
+        if endpoint == HttpLoginPage.PATH:
+            body = self._form(HttpLoginPage, {
+                "username": self.login_username, "password": self.login_password
+            })
+        else:
+            password = "Load@123"
+            body = self._form(HttpRegisterPage, {
+                "name": "Load User",
+                "email": TestDataGenerator.generate_email("open"),
+                "username": TestDataGenerator.generate_username("open"),
+                "password": password,
+                "repassword": password,
+            })
+        return (
+            f"POST {self.prefix}/{endpoint} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            "Content-Type: application/x-www-form-urlencoded\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+            f"{body}"
+        ).encode("utf-8")
+
+    async def _send(self, request):
+        """Send one request on a fresh connection and read the response"""
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.timeout
+        )
+        try:
+            writer.write(request)
+            await writer.drain()
+            raw = await asyncio.wait_for(reader.read(), self.timeout)
+        finally:
+            writer.close()
+        return parse_response(raw)
+
+    async def _issue(self, endpoint, scheduled, stats):
+        """Send one request and record latency since its scheduled arrival"""
+        loop = asyncio.get_running_loop()
+        try:
+            ok = is_success(*await self._send(self._request(endpoint)))
+        except (OSError, asyncio.TimeoutError, ValueError, IndexError):
+            ok = False
+        stats.record(endpoint, loop.time() - scheduled, ok)
+
+    async def run_step(self, rate, duration):
+        """Offer rate requests/second for duration seconds"""
+        loop = asyncio.get_running_loop()
+        stats = LatencyStats()
+        total = max(1, int(rate * duration))
+        login_every = _mix_pattern(self.login_share)
+        tasks = []
+
+        stats.start()
+        start = loop.time()
+        for i in range(total):
+            scheduled = start + i / rate
+            delay = scheduled - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            endpoint = HttpLoginPage.PATH if next(login_every) else HttpRegisterPage.PATH
+            tasks.append(asyncio.create_task(self._issue(endpoint, scheduled, stats)))
+        await asyncio.gather(*tasks)
+        stats.stop()
+        return stats
+
+    async def sweep(self, rates, duration):
+        """Run one step per rate and return the rate-vs-latency curve"""
+        curve = []
+        for rate in rates:
+            stats = await self.run_step(rate, duration)
+            curve.append(curve_point(rate, duration, stats))
+        return curve
+
+    def run(self, rates, duration):
+        """Synchronous wrapper around sweep()"""
+        return asyncio.run(self.sweep(rates, duration))
+
+
+def _mix_pattern(login_share):
+    """Endless deterministic True/False pattern with the given True share"""
+    slots = 20
+    logins = int(round(login_share * slots))
+    return itertools.cycle([i * logins // slots != (i + 1) * logins // slots for i in range(slots)])
+
+
+def curve_point(rate, duration, stats):
+    """Combine one step's per-endpoint stats into a single curve point"""
+    summary = stats.summary()
+    samples = stats.samples()
+    errors = sum(s["errors"] for s in summary.values())
+    return {
+        "rate": rate,
+        "offered": len(samples),
+        "throughput_rps": (len(samples) - errors) / max(stats.duration, duration),
+        "error_rate": errors / len(samples) if samples else 0.0,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "endpoints": summary,
+    }
+
+
+def format_curve(curve, knee=None):
+    """Render the rate-vs-latency curve as a plain text table"""
+    lines = [f"{'Rate':>8}{'Done/s':>9}{'Errors':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"]
+    for point in curve:
+        marker = "  <- knee" if knee is not None and point["rate"] == knee else ""
+        lines.append(
+            f"{point['rate']:>8.1f}{point['throughput_rps']:>9.1f}{point['error_rate']:>9.1%}"
+            f"{point['p50_ms']:>10.1f}{point['p95_ms']:>10.1f}{point['p99_ms']:>10.1f}{marker}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,15 @@
+"""
+Shared statistics helpers for the performance tools and page timings
+
+Kept free of page object and test helper imports, so pages/ can use it
+without pulling in the load harness.
+"""
+import math
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
@@ -0,0 +1,161 @@
+"""
+users-table scaling benchmark for the login/register lookup path
+
+login.php and register.php's cek_nama both run
+SELECT * FROM users WHERE username = '...' before doing anything else.
+This grows the table step by step and, at every size, times that lookup
+directly in MySQL and through both endpoints, and checks its EXPLAIN plan.
+"""
+from pages.http_backend import HttpLoginPage, HttpRegisterPage, create_http_adapter
+from perf.bench import describe, measure
+from test_helpers import TestDataGenerator
+
+LOOKUP_QUERY = "SELECT * FROM users WHERE username = %s"
+
+
+def table_size(connection):
+    """Number of rows in the users table"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT COUNT(*) FROM users")
+        return cursor.fetchone()[0]
+    finally:
+        cursor.close()
+
+
+def explain_lookup(connection, username):
+    """EXPLAIN rows of the username lookup, as dicts"""
+    cursor = connection.cursor(dictionary=True)
+    try:
+        cursor.execute("EXPLAIN " + LOOKUP_QUERY, (username,))
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def plan_problems(plan):
+    """Human readable problems of an EXPLAIN plan for the users table"""
+    problems = []
+    for row in plan:
+        if row.get('table') != 'users':
+            continue
+        access = row.get('type')
+        if access == 'ALL':
+            problems.append(f"full table scan on users (~{row.get('rows')} rows examined)")
+        elif access == 'index':
+            problems.append(f"full index scan on users (~{row.get('rows')} rows examined)")
+        elif access is not None and not row.get('key'):
+            problems.append(f"lookup on users uses no index (access type {access})")
+        # access None: MySQL answered from a const/unique index probe, e.g.
+        # "no matching row in const table" for a missing username
+    return problems
+
+
+def username_index_problems(connection):
+    """Flag a users table without an index that starts with username"""
+    cursor = connection.cursor(dictionary=True)
+    try:
+        cursor.execute("SHOW INDEX FROM users")
+        indexes = cursor.fetchall()
+    finally:
+        cursor.close()
+    leading = [
+        index['Key_name'] for index in indexes
+        if index['Column_name'] == 'username' and index['Seq_in_index'] == 1
+    ]
+    if not leading:
+        return ["no index on users.username"]
+    return []
+
+
+def measure_lookup(connection, username, iterations=30, warmup=3):
+    """Time the raw username lookup"""
+    cursor = connection.cursor()
+
+    def _lookup():
+        cursor.execute(LOOKUP_QUERY, (username,))
+        cursor.fetchall()
+
+    try:
+        return measure(_lookup, iterations=iterations, warmup=warmup)
+    finally:
+        cursor.close()
+
+
+def measure_login(base_url, username, password, adapter, iterations=30, warmup=3):
+    """Time successful logins, each without the previous session cookie"""
+    page = HttpLoginPage(base_url=base_url, adapter=adapter)
+    return measure(
+        lambda: page.login(username, password), iterations, warmup, setup=page.session.cookies.clear
+    )
+
+
+def measure_register(base_url, adapter, iterations=30, warmup=3):
+    """Time registrations of fresh users, which includes the cek_nama lookup"""
+    page = HttpRegisterPage(base_url=base_url, adapter=adapter)
+
+    def _register():
+        page.register(
+            'Scale User',
+            TestDataGenerator.generate_email('scale'),
+            TestDataGenerator.generate_username('scale'),
+            'Scale@123',
+            'Scale@123'
+        )
+
+    return measure(_register, iterations, warmup, setup=page.session.cookies.clear)
+
+
+def run_scaling(pool, seed, base_url, login_username, login_password, sizes,
+                iterations=30, warmup=3):
+    """
+    Grow the users table to each size and measure the lookup path
+
+    pool is a ConnectionPool; seed(count) must insert count more rows (e.g.
+    the seed_users fixture). Sizes below the current table size are
+    measured at the current size.
+    """
+    adapter = create_http_adapter(pool_size=1)
+    missing = TestDataGenerator.generate_username('missing')
+    results = []
+    try:
+        for size in sorted(sizes):
+            with pool.connection() as connection:
+                current = table_size(connection)
+            if current < size:
+                seed(size - current)
+
+            with pool.connection() as connection:
+                plan = explain_lookup(connection, login_username)
+                results.append({
+                    'size': size,
+                    'rows': table_size(connection),
+                    'plan': plan,
+                    'problems': plan_problems(plan) + plan_problems(explain_lookup(connection, missing)),
+                    'lookup_hit': describe(measure_lookup(connection, login_username, iterations, warmup)),
+                    'lookup_miss': describe(measure_lookup(connection, missing, iterations, warmup)),
+                })
+            results[-1]['login'] = describe(measure_login(
+                base_url, login_username, login_password, adapter, iterations, warmup
+            ))
+            results[-1]['register'] = describe(measure_register(base_url, adapter, iterations, warmup))
+    finally:
+        adapter.close()
+    return results
+
+
+def format_scaling(results):
+    """Render median latencies per table size as a plain text table"""
+    lines = [
+        f"{'Rows':>9}{'Access':>8}{'Key':>12}{'Lookup ms':>11}{'Miss ms':>9}"
+        f"{'Login ms':>10}{'Register ms':>13}  Problems"
+    ]
+    for result in results:
+        users_row = next((row for row in result['plan'] if row.get('table') == 'users'), {})
+        lines.append(
+            f"{result['rows']:>9}{str(users_row.get('type')):>8}{str(users_row.get('key')):>12}"
+            f"{result['lookup_hit']['median_ms']:>11.2f}{result['lookup_miss']['median_ms']:>9.2f}"
+            f"{result['login']['median_ms']:>10.1f}{result['register']['median_ms']:>13.1f}"
+            f"  {'; '.join(result['problems']) or '-'}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1 @@
+# Plugins package
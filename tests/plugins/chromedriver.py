@@ -0,0 +1,63 @@
+"""
+ChromeDriver Plugin - resolve the driver binary once per run
+
+The xdist controller looks the path up before the workers start, from the
+disk cache and PATH only (no network), and hands it to them in
+workerinput. When that finds nothing, each worker resolves the driver on
+first use, so runs that need no browser never touch webdriver-manager.
+"""
+import os
+
+import pytest
+
+from driver_resolver import ChromeDriverResolver
+
+_RESOLVED = "_chromedriver_path"
+_CONTROLLER_LOOKUP = "_chromedriver_controller_lookup"
+
+
+def pytest_addoption(parser):
+    """Register chromedriver options"""
+    group = parser.getgroup("chromedriver")
+    group.addoption(
+        "--chromedriver-offline", action="store_true",
+        default=os.environ.get("CHROMEDRIVER_OFFLINE", "") not in ("", "0", "false"),
+        help="Never download chromedriver; use the cache, PATH or CHROMEDRIVER_PATH only"
+    )
+
+
+def resolve_chromedriver(config):
+    """Return the chromedriver path for this run, resolving it at most once"""
+    path = getattr(config, _RESOLVED, None)
+    if path:
+        return path
+
+    workerinput = getattr(config, "workerinput", {})
+    path = workerinput.get("chromedriver_path")
+    if not path:
+        resolver = ChromeDriverResolver(offline=config.getoption("chromedriver_offline"))
+        path = resolver.resolve()
+    setattr(config, _RESOLVED, path)
+    return path
+
+
+def _resolve_offline_once(config):
+    """Controller side: the driver path from disk only, looked up once for all workers"""
+    if not hasattr(config, _CONTROLLER_LOOKUP):
+        try:
+            path = getattr(config, _RESOLVED, None) or ChromeDriverResolver(offline=True).resolve()
+        except Exception as e:
+            # Not cached yet or webdriver-manager trouble: workers resolve it
+            # themselves, and only if a selected test needs a browser
+            print(f"Warning: chromedriver not resolved up front, workers will resolve it: {e}")
+            path = None
+        setattr(config, _CONTROLLER_LOOKUP, path)
+    return getattr(config, _CONTROLLER_LOOKUP)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Share the controller's cached chromedriver path with an xdist worker"""
+    path = _resolve_offline_once(node.config)
+    if path:
+        node.workerinput["chromedriver_path"] = path
@@ -0,0 +1,134 @@
+"""
+Duration Schedule Plugin - pack tests onto xdist workers longest first
+
+Every run stores a smoothed duration per test in the pytest cache. With
+--duration-schedule and -n, the work units (single tests, or every test
+sharing an xdist_group mark) are handed out longest first, which is the
+classic LPT heuristic: workers that finish early pick up the short tests
+at the end, so wall-clock time approaches total test time / workers.
+
+Mark tests that share an expensive fixture, e.g. the same inserted user,
+with @pytest.mark.xdist_group("name") to keep them on one worker.
+"""
+import time
+
+import pytest
+
+CACHE_KEY = "duration/tests"
+SMOOTHING = 0.5  # weight of the newest run in the stored duration
+
+
+def pytest_addoption(parser):
+    """Register duration scheduling options"""
+    group = parser.getgroup("duration-schedule")
+    group.addoption(
+        "--duration-schedule", action="store_true", default=False,
+        help="With -n: distribute tests longest first using recorded durations"
+    )
+
+
+def pytest_configure(config):
+    """Record durations on every run; schedule by them when asked to"""
+    if hasattr(config, "workerinput"):
+        if config.getoption("duration_schedule"):
+            # Workers re-parse the command line; tag xdist_group tests like --dist=loadgroup
+            config.option.loadgroup = True
+        return
+    if not hasattr(config, "cache"):
+        return
+    if config.getoption("duration_schedule") and config.getoption("dist", "no") in ("load", "loadgroup"):
+        config.option.dist = "loadgroup"
+    config.pluginmanager.register(DurationPlugin(config), "duration_plugin")
+
+
+def base_nodeid(nodeid):
+    """nodeid without the '@group' suffix xdist adds for loadgroup"""
+    if nodeid.rfind("@") > nodeid.rfind("]"):
+        return nodeid.rsplit("@", 1)[0]
+    return nodeid
+
+
+def _duration_scheduling():
+    """LoadGroupScheduling subclass that hands out the longest units first"""
+    from xdist.scheduler import LoadGroupScheduling
+
+    class DurationScheduling(LoadGroupScheduling):
+        """Longest-processing-time-first scheduling of xdist work units"""
+
+        def __init__(self, config, log, history):
+            """Initialize scheduler with recorded durations per test"""
+            super().__init__(config, log)
+            self.history = history
+            self._sorted = False
+
+        def _estimate(self, nodeid):
+            """Recorded duration of nodeid, or the mean for unseen tests"""
+            if nodeid in self.history:
+                return self.history[nodeid]
+            return self._default
+
+        def _assign_work_unit(self, node):
+            """Sort the queue once, longest unit first, then assign as usual"""
+            if not self._sorted:
+                known = list(self.history.values())
+                self._default = sum(known) / len(known) if known else 1.0
+                units = sorted(
+                    self.workqueue.items(),
+                    key=lambda item: sum(self._estimate(base_nodeid(nodeid)) for nodeid in item[1]),
+                    reverse=True,
+                )
+                self.workqueue.clear()
+                self.workqueue.update(units)
+                self._sorted = True
+            super()._assign_work_unit(node)
+
+    return DurationScheduling
+
+
+class DurationPlugin:
+    """Keeps the duration history and builds the scheduler (controller only)"""
+
+    def __init__(self, config):
+        """Initialize plugin"""
+        self.config = config
+        self.history = config.cache.get(CACHE_KEY, {})
+        self.current = {}
+        self.workers = 0
+        self.started = None
+
+    def pytest_sessionstart(self, session):
+        """Start the wall clock"""
+        self.started = time.perf_counter()
+
+    def pytest_runtest_logreport(self, report):
+        """Sum setup, call and teardown time per test"""
+        key = base_nodeid(report.nodeid)
+        self.current[key] = self.current.get(key, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        """Blend this run's durations into the history"""
+        for key, seconds in self.current.items():
+            previous = self.history.get(key)
+            self.history[key] = seconds if previous is None else (
+                SMOOTHING * seconds + (1 - SMOOTHING) * previous
+            )
+        self.config.cache.set(CACHE_KEY, self.history)
+
+    @pytest.hookimpl(tryfirst=True, optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        """Replace xdist's scheduler when --duration-schedule is given"""
+        if not config.getoption("duration_schedule") or config.getvalue("dist") != "loadgroup":
+            return None
+        self.workers = config.getoption("numprocesses") or 0
+        return _duration_scheduling()(config, log, self.history)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Compare wall-clock time with the ideal, total / workers"""
+        if not self.workers or not self.current or self.started is None:
+            return
+        total = sum(self.current.values())
+        wall = time.perf_counter() - self.started
+        terminalreporter.write_line(
+            f"duration schedule: {total:.1f} s of tests on {self.workers} workers, "
+            f"ideal {total / self.workers:.1f} s, wall clock {wall:.1f} s"
+        )
@@ -0,0 +1,110 @@
+"""
+Failure Artifacts Plugin - screenshot, page source, URL and console log of failed tests
+
+The browser is read while the test's driver is still checked out (the
+call report is made before fixture teardown); the bytes then go to the
+background ArtifactWriter, so neither the test nor its teardown waits on
+disk I/O. Passing tests cost nothing. Under xdist the workers only write;
+the controller enforces the size cap once they have finished.
+"""
+import json
+import os
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from artifact_writer import ArtifactWriter, rotate
+
+_WRITER = "_artifact_writer"
+
+
+def pytest_addoption(parser):
+    """Register failure artifact options"""
+    group = parser.getgroup("failure-artifacts")
+    group.addoption(
+        "--artifacts-dir", action="store", default=os.environ.get("ARTIFACTS_DIR", "artifacts"),
+        help="Directory for screenshots, page sources and console logs of failed tests"
+    )
+    group.addoption(
+        "--artifacts-max-mb", action="store", type=float,
+        default=float(os.environ.get("ARTIFACTS_MAX_MB", 200)),
+        help="Delete the oldest failure artifacts once the directory exceeds this size (0 disables capture)"
+    )
+
+
+def _writer(config):
+    """The process' ArtifactWriter, started on the first failure"""
+    writer = getattr(config, _WRITER, None)
+    if writer is None:
+        max_bytes = int(config.getoption("artifacts_max_mb") * 1024 * 1024)
+        # Workers would race each other pruning the shared directory
+        writer = ArtifactWriter(
+            config.getoption("artifacts_dir"), max_bytes, prune=not hasattr(config, "workerinput")
+        )
+        setattr(config, _WRITER, writer)
+    return writer
+
+
+def _browser_of(item):
+    """The test's WebDriver or page object, if it used one"""
+    funcargs = getattr(item, "funcargs", {})
+    for name in ("driver", "driver_ui", "login_page", "register_page"):
+        target = funcargs.get(name)
+        if target is not None:
+            return getattr(target, "driver", target)
+    return None
+
+
+def capture(browser):
+    """In-memory artifacts of a WebDriver (or HTTP page object): {filename: bytes}"""
+    files = {}
+    try:
+        files["url.txt"] = str(browser.current_url).encode("utf-8")
+        files["page.html"] = browser.page_source.encode("utf-8")
+    except (WebDriverException, AttributeError):
+        pass
+    if hasattr(browser, "get_screenshot_as_png"):
+        try:
+            files["screenshot.png"] = browser.get_screenshot_as_png()
+        except WebDriverException:
+            pass
+        try:
+            files["console.json"] = json.dumps(browser.get_log("browser"), indent=2).encode("utf-8")
+        except (WebDriverException, AttributeError, ValueError):
+            # Console logs need goog:loggingPrefs, other drivers have none
+            pass
+    return files
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Capture artifacts when the setup or call phase of a test fails"""
+    outcome = yield
+    report = outcome.get_result()
+    if not report.failed or report.when == "teardown" or item.config.getoption("artifacts_max_mb") <= 0:
+        return
+    browser = _browser_of(item)
+    if browser is None:
+        return
+    files = capture(browser)
+    if files:
+        folder = _writer(item.config).submit(item.nodeid, files)
+        # The teardown report carries item.user_properties into the JUnit XML
+        item.user_properties.append(("artifacts", str(folder)))
+        report.sections.append(("failure artifacts", str(folder)))
+
+
+def pytest_unconfigure(config):
+    """Flush queued artifacts before the process exits, then enforce the cap"""
+    writer = getattr(config, _WRITER, None)
+    if writer is not None:
+        writer.close()
+    directory = config.getoption("artifacts_dir")
+    if hasattr(config, "workerinput") or config.getoption("artifacts_max_mb") <= 0 \
+            or not os.path.isdir(directory):
+        return
+    # The xdist workers have exited by now, nobody else is writing
+    try:
+        rotate(directory, int(config.getoption("artifacts_max_mb") * 1024 * 1024))
+    except OSError as e:
+        print(f"Warning: Could not prune failure artifacts in {directory}: {e}")
@@ -0,0 +1,245 @@
+"""
+Impact Plugin - skip tests whose inputs did not change
+
+With --impact every passing test records what it exercised: the Python
+files of the repo that ran while it was set up, called and torn down, and
+the PHP pages it requested (plus the files those pages require). The next
+run hashes those files again and skips a test when every hash matches its
+last passing run, so editing register.php only re-runs the tests that
+loaded register.php.
+"""
+import hashlib
+import json
+import re
+import sys
+import threading
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import pytest
+
+CACHE_KEY = "impact/results"
+# Inputs of every test, whether or not their code ran during that test
+GLOBAL_INPUTS = ("pytest.ini", "requirements.txt", "tests/conftest.py", "tests/fixtures/*.py")
+# Options that change what a test does, part of every cache entry
+OPTION_INPUTS = ("page_backend", "db_backend", "app_url", "local_assets", "page_load_strategy")
+SKIP_REASON = "impact: inputs unchanged since last pass"
+REQUIRE_PATTERN = re.compile(r"""\b(?:require|include)(?:_once)?\s*\(?\s*['"]([^'"]+\.php)['"]""")
+
+
+def pytest_addoption(parser):
+    """Register test impact options"""
+    group = parser.getgroup("test-impact")
+    group.addoption(
+        "--impact", action="store_true", default=False,
+        help="Skip tests whose recorded inputs are unchanged since they last passed"
+    )
+    group.addoption(
+        "--impact-reset", action="store_true", default=False,
+        help="With --impact: run everything and record fresh inputs"
+    )
+
+
+def pytest_configure(config):
+    """Enable the plugin with --impact"""
+    if config.getoption("impact"):
+        config.pluginmanager.register(ImpactPlugin(config), "impact_plugin")
+
+
+class _Recorder:
+    """Profile hook collecting repo files and requested URLs of one test"""
+
+    def __init__(self, rootdir):
+        """Initialize recorder for the repository at rootdir"""
+        self.rootdir = str(rootdir)
+        self.files = set()
+        self.urls = set()
+        self._kinds = {}
+
+    def _kind(self, filename):
+        """Classify a code file once: repo source, URL source or ignored"""
+        kind = self._kinds.get(filename)
+        if kind is None:
+            normalized = filename.replace("\\", "/")
+            if normalized.endswith("selenium/webdriver/remote/webdriver.py"):
+                kind = "webdriver"
+            elif normalized.endswith("requests/sessions.py"):
+                kind = "requests"
+            elif filename == __file__:
+                kind = "other"
+            elif filename.startswith(self.rootdir) and "site-packages" not in filename:
+                kind = "repo"
+            else:
+                kind = "other"
+            self._kinds[filename] = kind
+        return kind
+
+    def __call__(self, frame, event, arg):
+        if event not in ("call", "return"):
+            return
+        code = frame.f_code
+        kind = self._kind(code.co_filename)
+        if kind == "repo":
+            if event == "call":
+                self.files.add(code.co_filename)
+        elif kind == "webdriver":
+            if event == "call" and code.co_name == "get":
+                self.urls.add(frame.f_locals.get("url"))
+            elif event == "return" and code.co_name == "current_url" and isinstance(arg, str):
+                self.urls.add(arg)
+        elif kind == "requests" and event == "call" and code.co_name == "request":
+            self.urls.add(frame.f_locals.get("url"))
+
+    def start(self):
+        """Install the hook in this and future threads"""
+        threading.setprofile(self)
+        sys.setprofile(self)
+
+    def stop(self):
+        """Remove the hook"""
+        sys.setprofile(None)
+        threading.setprofile(None)
+
+
+class ImpactPlugin:
+    """Records test inputs and skips tests whose inputs are unchanged"""
+
+    def __init__(self, config):
+        """Initialize plugin"""
+        self.config = config
+        self.rootdir = Path(str(config.rootpath))
+        self.previous = {} if config.getoption("impact_reset") else config.cache.get(CACHE_KEY, {})
+        self.results = {}
+        self.failed = set()
+        self.skipped = 0
+        self._hashes = {}
+        self.options = {name: config.getoption(name, None) for name in OPTION_INPUTS}
+
+    # ----- hashing -----
+
+    def _hash(self, relpath):
+        """Content hash of a repo file, None when it does not exist"""
+        if relpath not in self._hashes:
+            path = self.rootdir / relpath
+            self._hashes[relpath] = (
+                hashlib.sha256(path.read_bytes()).hexdigest() if path.is_file() else None
+            )
+        return self._hashes[relpath]
+
+    def _global_inputs(self):
+        """Relative paths of the inputs shared by every test"""
+        paths = set()
+        for pattern in GLOBAL_INPUTS:
+            paths.update(str(p.relative_to(self.rootdir)) for p in self.rootdir.glob(pattern))
+        return paths
+
+    def _php_inputs(self, urls):
+        """PHP pages named by the URLs, plus the files they require"""
+        pending = []
+        for url in urls:
+            name = Path(urlsplit(url or "").path).name
+            if name.endswith(".php"):
+                pending.append(name)
+        found = set()
+        while pending:
+            relpath = pending.pop()
+            if relpath in found:
+                continue
+            found.add(relpath)
+            path = self.rootdir / relpath
+            if path.is_file():
+                text = path.read_text(encoding="utf-8", errors="replace")
+                pending.extend(REQUIRE_PATTERN.findall(text))
+        return found
+
+    def _unchanged(self, entry):
+        """True when the entry's inputs and options match this run"""
+        if entry.get('options') != self.options:
+            return False
+        return all(self._hash(relpath) == digest for relpath, digest in entry['inputs'].items())
+
+    # ----- collection -----
+
+    def pytest_collection_modifyitems(self, items):
+        """Skip tests whose inputs are unchanged since they last passed"""
+        for item in items:
+            entry = self.previous.get(item.nodeid)
+            if entry and self._unchanged(entry):
+                item.add_marker(pytest.mark.skip(reason=SKIP_REASON))
+                self.results[item.nodeid] = entry
+
+    # ----- recording -----
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        """Record the inputs of one test across setup, call and teardown"""
+        if item.nodeid in self.results:
+            yield
+            return
+        recorder = _Recorder(self.rootdir)
+        recorder.start()
+        try:
+            yield
+        finally:
+            recorder.stop()
+        self._store(item.nodeid, recorder)
+
+    def pytest_runtest_logreport(self, report):
+        """Remember which tests did not pass and count impact skips"""
+        if report.skipped and SKIP_REASON in str(report.longrepr):
+            self.skipped += 1
+        elif report.failed or report.skipped:
+            self.failed.add(report.nodeid)
+
+    def _store(self, nodeid, recorder):
+        """Save the inputs of a passing test"""
+        if nodeid in self.failed:
+            self.results.pop(nodeid, None)
+            return
+        relpaths = self._global_inputs() | self._php_inputs(recorder.urls)
+        for filename in recorder.files:
+            try:
+                relpaths.add(str(Path(filename).relative_to(self.rootdir)))
+            except ValueError:
+                continue
+        self.results[nodeid] = {
+            'options': self.options,
+            'inputs': {relpath: self._hash(relpath) for relpath in sorted(relpaths)},
+        }
+
+    # ----- xdist -----
+
+    def pytest_sessionfinish(self, session):
+        """Ship results to the xdist controller, or write them to the cache"""
+        workeroutput = getattr(self.config, "workeroutput", None)
+        if workeroutput is not None:
+            workeroutput['test_impact'] = json.dumps({
+                'results': self.results, 'failed': sorted(self.failed)
+            })
+            return
+        self._save()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """On the xdist controller, merge a finished worker's results"""
+        data = getattr(node, "workeroutput", {}).get('test_impact')
+        if data:
+            data = json.loads(data)
+            self.results.update(data['results'])
+            self.failed.update(data['failed'])
+
+    def _save(self):
+        """Merge this run into the stored results"""
+        merged = dict(self.previous)
+        for nodeid in self.failed:
+            merged.pop(nodeid, None)
+        merged.update({nodeid: entry for nodeid, entry in self.results.items() if nodeid not in self.failed})
+        self.config.cache.set(CACHE_KEY, merged)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Report how many tests were skipped by impact analysis"""
+        if hasattr(self.config, "workerinput"):
+            return
+        terminalreporter.write_line(
+            f"impact: {self.skipped} tests skipped with unchanged inputs"
+        )
@@ -0,0 +1,107 @@
+"""
+Navigation Timing Plugin - per-test page load timings and run-wide summary
+
+Tests that use the navigation_timings fixture, or every test when
+--navigation-timing is given, record the Navigation Timing of the pages
+they load; other tests skip the extra execute_script round trip per
+navigation. The entries are attached to the test result (user property
+"navigation_timing", shown in the JUnit XML and next to failures), and
+the fixture lets a test assert budgets on them. With --navigation-timing
+a per-page p50/p95 table is printed at the end.
+"""
+import pytest
+
+from pages import navigation_timing
+from pages.navigation_timing import METRICS, NavigationTimings
+
+
+def pytest_addoption(parser):
+    """Register navigation timing options"""
+    group = parser.getgroup("navigation-timing")
+    group.addoption(
+        "--navigation-timing", action="store_true", default=False,
+        help="Print per-page TTFB, DOMContentLoaded, load, bytes and requests at the end of the run"
+    )
+
+
+@pytest.fixture
+def navigation_timings():
+    """Navigation entries recorded so far by the current test"""
+    return navigation_timing.current()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item):
+    """Start a recorder before the test's fixtures run, if anyone reads it"""
+    if item.config.getoption("navigation_timing") or "navigation_timings" in item.fixturenames:
+        navigation_timing.start()
+    yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Attach the entries to the test result"""
+    yield
+    timings = navigation_timing.current()
+    if timings is None or not timings.entries:
+        return
+    item.user_properties.append(("navigation_timing", timings.entries))
+    item.add_report_section("call", "navigation timing", format_entries(timings.entries))
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_teardown(item):
+    """Stop recording once the test is done"""
+    navigation_timing.stop()
+
+
+def _ms(value):
+    return "-" if value is None else f"{value:.1f}"
+
+
+def format_entries(entries):
+    """One line per navigation"""
+    return "\n".join(
+        f"{entry['page'] or entry['url']}: ttfb {_ms(entry['ttfb_ms'])} ms, "
+        f"DOMContentLoaded {_ms(entry['dom_content_loaded_ms'])} ms, load {_ms(entry['load_ms'])} ms, "
+        f"{entry['bytes']} bytes, {entry['requests']} requests"
+        for entry in entries
+    )
+
+
+def pytest_configure(config):
+    """Collect the run-wide summary when asked to"""
+    if config.getoption("navigation_timing") and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(NavigationSummaryPlugin(), "navigation_summary_plugin")
+
+
+class NavigationSummaryPlugin:
+    """Merges the entries of every test, including those run on xdist workers"""
+
+    def __init__(self):
+        """Initialize plugin"""
+        self.timings = NavigationTimings()
+
+    def pytest_runtest_logreport(self, report):
+        """user_properties travel with the teardown report, also from workers"""
+        if report.when != "teardown":
+            return
+        for name, entries in report.user_properties:
+            if name == "navigation_timing":
+                for entry in entries:
+                    self.timings.record(dict(entry))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Print p50/p95 per page"""
+        summary = self.timings.summary()
+        if not summary:
+            return
+        terminalreporter.write_sep("=", "navigation timing (p50 / p95)")
+        terminalreporter.write_line(
+            f"{'Page':<16}{'Count':>6}  " + "".join(f"{metric:>26}" for metric in METRICS)
+        )
+        for page, row in summary.items():
+            cells = "".join(
+                f"{_ms(row[f'{metric}_p50']) + ' / ' + _ms(row[f'{metric}_p95']):>26}" for metric in METRICS
+            )
+            terminalreporter.write_line(f"{page:<16}{row['count']:>6}  {cells}")
@@ -0,0 +1,155 @@
+"""
+Phase Timing Plugin - where does suite time go?
+
+Records setup/teardown time per fixture and setup/call/teardown time per
+test, merges the numbers from pytest-xdist workers and prints a ranked
+"top costs" table. With --phase-timing-json the raw data is written in a
+format ReportHelper.load_phase_timing can read.
+"""
+import json
+import time
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """Register phase timing options"""
+    group = parser.getgroup("phase-timing")
+    group.addoption(
+        "--phase-timing", action="store_true", default=False,
+        help="Print the most expensive fixtures and test phases at the end of the run"
+    )
+    group.addoption(
+        "--phase-timing-top", action="store", type=int, default=15,
+        help="Number of rows in the top costs table"
+    )
+    group.addoption(
+        "--phase-timing-json", action="store", default=None, metavar="PATH",
+        help="Write per-test and per-fixture timings as JSON"
+    )
+
+
+def pytest_configure(config):
+    """Enable the plugin when one of its options is given"""
+    if config.getoption("phase_timing") or config.getoption("phase_timing_json"):
+        config.pluginmanager.register(PhaseTimingPlugin(config), "phase_timing_plugin")
+
+
+def _merge_fixture(fixtures, name, phase, seconds, count=1):
+    """Add one measurement to the fixture table"""
+    entry = fixtures.setdefault(name, {
+        'setup': 0.0, 'teardown': 0.0, 'setup_count': 0, 'teardown_count': 0
+    })
+    entry[phase] += seconds
+    entry[f'{phase}_count'] += count
+
+
+class PhaseTimingPlugin:
+    """Collects the timings of one pytest process"""
+
+    def __init__(self, config):
+        """Initialize plugin"""
+        self.config = config
+        self.fixtures = {}
+        self.tests = {}
+        self._teardown_started = {}
+
+    # ----- fixtures -----
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        """Time a fixture's setup and arm the teardown timer"""
+        start = time.perf_counter()
+        yield
+        name = f"{fixturedef.argname} ({fixturedef.scope})"
+        _merge_fixture(self.fixtures, name, 'setup', time.perf_counter() - start)
+
+        # Finalizers run last-in first-out, so this runs right before the
+        # fixture's own teardown; pytest_fixture_post_finalizer closes it.
+        key = id(fixturedef)
+        fixturedef.addfinalizer(lambda: self._teardown_started.__setitem__(key, time.perf_counter()))
+
+    def pytest_fixture_post_finalizer(self, fixturedef, request):
+        """Record a fixture's teardown time"""
+        start = self._teardown_started.pop(id(fixturedef), None)
+        if start is not None:
+            name = f"{fixturedef.argname} ({fixturedef.scope})"
+            _merge_fixture(self.fixtures, name, 'teardown', time.perf_counter() - start)
+
+    # ----- tests -----
+
+    def pytest_runtest_logreport(self, report):
+        """Record the duration and outcome of every test phase"""
+        entry = self.tests.setdefault(report.nodeid, {
+            'name': report.nodeid, 'status': 'PASSED',
+            'setup': 0.0, 'call': 0.0, 'teardown': 0.0
+        })
+        entry[report.when] = report.duration
+        if report.failed:
+            entry['status'] = 'FAILED'
+        elif report.skipped and entry['status'] != 'FAILED':
+            entry['status'] = 'SKIPPED'
+        entry['duration'] = entry['setup'] + entry['call'] + entry['teardown']
+
+    # ----- xdist -----
+
+    def pytest_sessionfinish(self, session):
+        """On an xdist worker, ship fixture timings to the controller"""
+        workeroutput = getattr(self.config, "workeroutput", None)
+        if workeroutput is not None:
+            workeroutput['phase_timing_fixtures'] = json.dumps(self.fixtures)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """On the xdist controller, merge a finished worker's fixture timings"""
+        data = getattr(node, "workeroutput", {}).get('phase_timing_fixtures')
+        if not data:
+            return
+        for name, entry in json.loads(data).items():
+            _merge_fixture(self.fixtures, name, 'setup', entry['setup'], entry['setup_count'])
+            _merge_fixture(self.fixtures, name, 'teardown', entry['teardown'], entry['teardown_count'])
+
+    # ----- reporting -----
+
+    def top_costs(self, limit=None):
+        """Fixture phases and test calls ranked by total time"""
+        rows = []
+        for name, entry in self.fixtures.items():
+            for phase in ('setup', 'teardown'):
+                if entry[f'{phase}_count']:
+                    rows.append(('fixture', name, phase, entry[f'{phase}_count'], entry[phase]))
+        for nodeid, entry in self.tests.items():
+            rows.append(('test', nodeid, 'call', 1, entry['call']))
+        rows.sort(key=lambda row: row[4], reverse=True)
+        return rows[:limit] if limit else rows
+
+    def as_dict(self):
+        """Machine readable timings"""
+        return {
+            'tests': list(self.tests.values()),
+            'fixtures': [dict(entry, name=name) for name, entry in sorted(self.fixtures.items())],
+        }
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Print the top costs table and write the JSON file"""
+        if hasattr(self.config, "workerinput"):
+            return
+
+        path = self.config.getoption("phase_timing_json")
+        if path:
+            with open(path, 'w') as f:
+                json.dump(self.as_dict(), f, indent=2)
+
+        if not self.config.getoption("phase_timing"):
+            return
+        rows = self.top_costs(self.config.getoption("phase_timing_top"))
+        total = sum(entry['duration'] for entry in self.tests.values())
+        terminalreporter.write_sep("=", "top costs")
+        terminalreporter.write_line(
+            f"{'Total s':>9} {'Mean ms':>9} {'Count':>6}  {'Kind':<8}{'Phase':<10}Name"
+        )
+        for kind, name, phase, count, seconds in rows:
+            terminalreporter.write_line(
+                f"{seconds:>9.2f} {seconds / count * 1000:>9.1f} {count:>6}  {kind:<8}{phase:<10}{name}"
+            )
+        terminalreporter.write_line(f"Sum of test durations: {total:.2f} s")
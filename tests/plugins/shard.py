@@ -0,0 +1,136 @@
+"""
+Shard Plugin - split the suite across CI machines with balanced shards
+
+--shard=i/n keeps the i-th of n shards and deselects the rest. Every
+machine computes the same split: work units (single tests, or all tests
+of one xdist_group) are ordered by estimated cost and handed greedily to
+the least loaded shard. The cost of a test is its recorded duration from
+--shard-durations (a --phase-timing-json file), else a guess from its
+markers. The local duration history is never used: it differs between
+machines, and so would the split.
+
+The shards' JUnit and --phase-timing-json files are combined afterwards
+with ReportHelper.merge_junit and ReportHelper.merge_phase_timing.
+"""
+import argparse
+import json
+
+import pytest
+
+from plugins.duration_schedule import base_nodeid
+
+# Guessed seconds for tests without a recorded duration, first match wins
+MARKER_COSTS = (
+    ("performance", 60.0),
+    ("benchmark", 30.0),
+    ("stub", 0.1),
+    ("browserless", 0.5),
+)
+DEFAULT_COST = 3.0  # one browser test
+
+
+def _parse_shard(value):
+    """'2/3' -> (2, 3)"""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected i/n, got {value!r}") from None
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard {value!r} out of range, expected 1 <= i <= n")
+    return index, count
+
+
+def pytest_addoption(parser):
+    """Register sharding options"""
+    group = parser.getgroup("shard")
+    group.addoption(
+        "--shard", action="store", type=_parse_shard, default=None, metavar="I/N",
+        help="Run only the I-th of N duration balanced shards of the suite"
+    )
+    group.addoption(
+        "--shard-durations", action="store", default=None, metavar="PATH",
+        help="--phase-timing-json file with the durations to balance by "
+             "(default: estimates from markers); every shard must use the same file"
+    )
+
+
+def load_durations(config):
+    """Recorded seconds per nodeid from --shard-durations, empty without it"""
+    path = config.getoption("shard_durations")
+    if not path:
+        return {}
+    try:
+        with open(path) as f:
+            timing = json.load(f)
+    except (OSError, ValueError) as e:
+        # Same file on every machine (e.g. a cold CI cache), so the same fallback
+        print(f"Warning: Could not read shard durations from {path}, using marker estimates: {e}")
+        return {}
+    return {base_nodeid(test['name']): test['duration'] for test in timing.get('tests', [])}
+
+
+def estimate_cost(item, durations):
+    """Recorded duration of item, or a guess from its markers"""
+    nodeid = base_nodeid(item.nodeid)
+    if nodeid in durations:
+        return durations[nodeid]
+    for marker, cost in MARKER_COSTS:
+        if item.get_closest_marker(marker) is not None:
+            return cost
+    return DEFAULT_COST
+
+
+def _unit_of(item):
+    """Tests of one xdist_group share fixtures, keep them in one shard"""
+    group = item.get_closest_marker("xdist_group")
+    if group is not None:
+        name = group.args[0] if group.args else group.kwargs.get("name", "default")
+        return f"group:{name}"
+    return item.nodeid
+
+
+def assign_shards(items, count, durations):
+    """Map nodeid -> shard index (1 based), longest unit first to the lightest shard"""
+    units = {}
+    for item in items:
+        units.setdefault(_unit_of(item), []).append(item)
+    costs = {unit: sum(estimate_cost(item, durations) for item in members) for unit, members in units.items()}
+
+    loads = [0.0] * count
+    assignment = {}
+    # The unit name breaks ties, so every machine computes the same split
+    for unit in sorted(units, key=lambda unit: (-costs[unit], unit)):
+        shard = min(range(count), key=lambda index: (loads[index], index))
+        loads[shard] += costs[unit]
+        for item in units[unit]:
+            assignment[item.nodeid] = shard + 1
+    return assignment, loads
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """Deselect every test outside the selected shard"""
+    shard = config.getoption("shard")
+    if shard is None:
+        return
+    index, count = shard
+    assignment, loads = assign_shards(items, count, load_durations(config))
+
+    selected = [item for item in items if assignment[item.nodeid] == index]
+    deselected = [item for item in items if assignment[item.nodeid] != index]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+    config._shard_loads = loads
+
+
+def pytest_report_collectionfinish(config, items):
+    """Show the estimated load of the selected shard"""
+    loads = getattr(config, "_shard_loads", None)
+    if loads is None or hasattr(config, "workerinput"):
+        return None
+    index, count = config.getoption("shard")
+    return (
+        f"shard {index}/{count}: {len(items)} tests, estimated {loads[index - 1]:.1f} s "
+        f"(shards {min(loads):.1f}-{max(loads):.1f} s)"
+    )
@@ -0,0 +1,91 @@
+"""
+Shared Chrome Plugin - one headless Chrome for every worker of a run
+
+With --driver-mode=context the xdist controller (or the single pytest
+process) launches one Chrome with remote debugging before the workers
+start and hands its address to them in workerinput. Each worker attaches
+one WebDriver session to it and every test gets its own incognito browser
+context, so adding workers adds chromedriver sessions, not browsers.
+"""
+import os
+from urllib.parse import urlsplit
+
+import pytest
+
+from asset_server import AssetCache, AssetServer, chrome_arguments, ensure_certificate
+from browser_contexts import SharedChrome
+from driver_resolver import find_chrome_binary
+
+_ADDRESS = "_shared_chrome_address"
+
+
+def pytest_addoption(parser):
+    """Register shared Chrome options"""
+    group = parser.getgroup("shared-chrome")
+    group.addoption(
+        "--driver-mode", action="store",
+        default=os.environ.get("SELENIUM_DRIVER_MODE", "pool"),
+        choices=("pool", "context"),
+        help="pool: warm Chrome per worker; context: one shared Chrome, an incognito context per test"
+    )
+
+
+def use_browser_contexts(config):
+    """True when tests get a browser context in the shared Chrome"""
+    return config.getoption("driver_mode") == "context"
+
+
+def allowed_hosts(config):
+    """Hosts Chrome may still reach with --local-assets: the app's own"""
+    hosts = ["localhost", "127.0.0.1"]
+    app_url = config.getoption("app_url")
+    if app_url:
+        hosts.append(urlsplit(app_url).hostname)
+    return hosts
+
+
+def _launch(config):
+    """Start the shared Chrome, and the asset server it uses with --local-assets"""
+    binary = find_chrome_binary()
+    if binary is None:
+        raise RuntimeError("--driver-mode=context needs Chrome; set CHROME_BIN or install google-chrome")
+
+    arguments = []
+    if config.getoption("local_assets"):
+        cache = AssetCache()
+        cache.populate()
+        certificate = ensure_certificate(cache.directory)
+        port = None
+        if certificate is not None:
+            server = AssetServer(cache, certificate).start()
+            config.add_cleanup(server.stop)
+            port = server.port
+        arguments.extend(chrome_arguments(port, allowed_hosts(config)))
+
+    chrome = SharedChrome(binary, arguments).start()
+    config.add_cleanup(chrome.stop)
+    return chrome.debugger_address
+
+
+def shared_chrome_address(config):
+    """host:port of the run's shared Chrome, launching it at most once"""
+    address = getattr(config, _ADDRESS, None)
+    if address:
+        return address
+
+    workerinput = getattr(config, "workerinput", {})
+    address = workerinput.get("shared_chrome_address") or _launch(config)
+    setattr(config, _ADDRESS, address)
+    return address
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Share the controller's Chrome with an xdist worker"""
+    if not use_browser_contexts(node.config):
+        return
+    try:
+        node.workerinput["shared_chrome_address"] = shared_chrome_address(node.config)
+    except RuntimeError as e:
+        # Browserless runs do not need Chrome; workers report the error if they do
+        print(f"Warning: Could not start the shared Chrome: {e}")
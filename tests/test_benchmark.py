@@ -0,0 +1,117 @@
+"""
+Microbenchmarks for Page Object Operations
+Times the LoginPage/RegisterPage primitives against a stored baseline
+"""
+import pytest
+
+from pages.login_page import LoginPage
+from pages.register_page import RegisterPage
+from perf.bench import BaselineStore, compare, describe, measure
+
+
+def _login_page_at(driver, submit_empty=False):
+    """Login page loaded in driver, optionally showing the empty-form error"""
+    page = LoginPage(driver)
+    page.navigate_to()
+    if submit_empty:
+        page.submit_and_wait_for()
+    return page
+
+
+def bench_navigate_to(driver):
+    """Load login.php"""
+    page = LoginPage(driver)
+    return dict(fn=page.navigate_to)
+
+
+def bench_enter_username(driver):
+    """Wait + clear + send_keys on the username field"""
+    page = _login_page_at(driver)
+    return dict(fn=lambda: page.enter_username('benchuser'))
+
+
+def bench_click_sign_in_button(driver):
+    """Click Sign In on a freshly loaded page"""
+    page = LoginPage(driver)
+    return dict(fn=page.click_sign_in_button, setup=page.navigate_to)
+
+
+def bench_get_error_message(driver):
+    """Read the error alert of a rejected login"""
+    page = _login_page_at(driver, submit_empty=True)
+    return dict(fn=page.get_error_message)
+
+
+def bench_register(driver):
+    """Fill the register form in one script call and submit"""
+    page = RegisterPage(driver)
+    # Mismatched passwords: the full form round trip without creating a user
+    return dict(
+        fn=lambda: page.register('Bench User', 'bench@example.com', 'benchuser', 'Bench@123', 'Other@123'),
+        setup=page.navigate_to
+    )
+
+
+def bench_register_typing(driver):
+    """Type into every register field, then submit"""
+    page = RegisterPage(driver)
+    return dict(
+        fn=lambda: page.register(
+            'Bench User', 'bench@example.com', 'benchuser', 'Bench@123', 'Other@123', typing=True
+        ),
+        setup=page.navigate_to
+    )
+
+
+BENCHMARKS = {
+    'login_page.navigate_to': bench_navigate_to,
+    'login_page.enter_username': bench_enter_username,
+    'login_page.click_sign_in_button': bench_click_sign_in_button,
+    'login_page.get_error_message': bench_get_error_message,
+    'register_page.register': bench_register,
+    'register_page.register_typing': bench_register_typing,
+}
+
+
+class TestPageObjectBenchmarks:
+    """Benchmarks for page object primitives (BENCH)"""
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("name", sorted(BENCHMARKS))
+    def test_bench_page_object_operation(self, request, driver, name):
+        """
+        BENCH: Time one page object primitive
+        
+        Steps:
+        1. Prepare the page (not timed)
+        2. Run --bench-warmup untimed and --bench-iterations timed calls
+        3. Compare with the stored baseline, or store it with --bench-save-baseline
+        
+        Expected Result:
+        - No statistically significant slowdown versus the baseline
+        """
+        config = request.config
+        samples = measure(
+            iterations=config.getoption("bench_iterations"),
+            warmup=config.getoption("bench_warmup"),
+            **BENCHMARKS[name](driver)
+        )
+        summary = describe(samples)
+        request.node.user_properties.append(("benchmark", summary))
+        print(f"\n{name}: median {summary['median_ms']:.2f} ms, "
+              f"mean {summary['mean_ms']:.2f} ms ± {summary['stdev_ms']:.2f} ms (n={summary['n']})")
+        
+        store = BaselineStore(config.getoption("bench_dir"))
+        if config.getoption("bench_save_baseline"):
+            store.save(name, samples)
+            return
+        
+        baseline = store.load(name)
+        if baseline is None:
+            pytest.skip(f"No baseline for {name}; run with --bench-save-baseline first")
+        
+        result = compare(samples, baseline)
+        assert not result['regression'], (
+            f"{name} regressed: median {result['slowdown']:+.1%} vs baseline "
+            f"(p={result['p_value']:.4f})"
+        )
@@ -3,9 +3,221 @@ Test Utilities and Helper Functions
 """
 import subprocess
 import hashlib
+import itertools
 import json
+import os
+import select
+import shutil
+import threading
+import xml.etree.ElementTree as ET
 from datetime import datetime
 
+import bcrypt
+
+
+class PasswordHasher:
+    """
+    In-process bcrypt hashing compatible with PHP password_hash/password_verify
+
+    Hashes use the $2y$ prefix and cost 10, the same as PHP PASSWORD_DEFAULT.
+    Results are cached per password for the whole session, so fixtures that
+    reuse a password only pay for bcrypt once.
+    """
+
+    PHP_PREFIX = b"$2y$"
+    COST = 10
+    MAX_BYTES = 72  # bcrypt (and PHP) ignore everything past 72 bytes
+
+    _cache = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def hash(cls, password):
+        """Return a cached PHP compatible bcrypt hash for password"""
+        with cls._lock:
+            cached = cls._cache.get(password)
+        if cached is not None:
+            return cached
+
+        hashed = cls.compute(password)
+        with cls._lock:
+            return cls._cache.setdefault(password, hashed)
+
+    @classmethod
+    def compute(cls, password, cost=None):
+        """Hash password with a fresh salt, bypassing the cache"""
+        salt = bcrypt.gensalt(rounds=cls.COST if cost is None else cost)
+        hashed = bcrypt.hashpw(cls._encode(password), salt)
+        return (cls.PHP_PREFIX + hashed[4:]).decode("ascii")
+
+    @classmethod
+    def verify(cls, password, hash_value):
+        """Check password against a $2y$/$2b$/$2a$ bcrypt hash"""
+        if not hash_value or not hash_value.startswith(("$2y$", "$2b$", "$2a$")):
+            return False
+        normalized = b"$2b$" + hash_value.encode("ascii")[4:]
+        return bcrypt.checkpw(cls._encode(password), normalized)
+
+    @classmethod
+    def clear_cache(cls):
+        """Forget all cached hashes"""
+        with cls._lock:
+            cls._cache.clear()
+
+    @classmethod
+    def _encode(cls, password):
+        """Encode and truncate password the way PHP bcrypt does"""
+        return password.encode("utf-8")[:cls.MAX_BYTES]
+
+
+class PhpWorkerError(RuntimeError):
+    """The PHP worker could not answer a request"""
+
+
+class PhpWorker:
+    """
+    Long-lived php process answering batched password_hash/password_verify calls
+
+    One JSON request per line on stdin, one JSON response per line on
+    stdout, so passwords are never spliced into PHP code. Large batches are
+    sent in chunks of CHUNK_SIZE, so timeout applies to each chunk rather
+    than to the whole batch. A worker that died or hung is restarted and
+    the chunk retried once.
+    """
+
+    CHUNK_SIZE = 50
+
+    SCRIPT = r"""
+while (($line = fgets(STDIN)) !== false) {
+    $request = json_decode($line, true);
+    $results = [];
+    if (!is_array($request)) {
+        $response = ['error' => 'invalid request'];
+    } elseif ($request['op'] === 'hash') {
+        $options = isset($request['cost']) ? ['cost' => (int) $request['cost']] : [];
+        foreach ($request['items'] as $password) {
+            $results[] = password_hash($password, PASSWORD_DEFAULT, $options);
+        }
+        $response = ['results' => $results];
+    } elseif ($request['op'] === 'verify') {
+        foreach ($request['items'] as $pair) {
+            $results[] = password_verify($pair[0], $pair[1]);
+        }
+        $response = ['results' => $results];
+    } else {
+        $response = ['error' => 'unknown op ' . $request['op']];
+    }
+    echo json_encode($response), "\n";
+    fflush(STDOUT);
+}
+"""
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, php=None, timeout=30):
+        """Initialize worker; the php process starts on the first request"""
+        self.php = php or os.environ.get("PHP_BIN") or shutil.which("php") or "php"
+        self.timeout = timeout
+        self.process = None
+        self.restarts = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        """Worker shared by every caller in this pytest process"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def close_shared(cls):
+        """Stop the shared worker"""
+        with cls._shared_lock:
+            worker, cls._shared = cls._shared, None
+        if worker is not None:
+            worker.close()
+
+    def hash(self, passwords, cost=None):
+        """password_hash(PASSWORD_DEFAULT) of every password"""
+        extra = {} if cost is None else {'cost': cost}
+        return self._request('hash', list(passwords), **extra)
+
+    def verify(self, pairs):
+        """password_verify result of every (password, hash) pair"""
+        return self._request('verify', [[password, hash_value] for password, hash_value in pairs])
+
+    def close(self):
+        """Stop the php process"""
+        with self._lock:
+            self._stop()
+
+    def _request(self, op, items, **extra):
+        """Send items in chunks of CHUNK_SIZE; returns all results in order"""
+        results = []
+        for start in range(0, len(items), self.CHUNK_SIZE):
+            results.extend(self._request_chunk(op, items[start:start + self.CHUNK_SIZE], **extra))
+        return results
+
+    def _request_chunk(self, op, items, **extra):
+        """Send one request, restarting the worker and retrying once on failure"""
+        line = json.dumps(dict(extra, op=op, items=items)) + "\n"
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    if self.process is None or self.process.poll() is not None:
+                        self._start()
+                    response = self._exchange(line)
+                    break
+                except (OSError, ValueError, PhpWorkerError) as e:
+                    self._stop()
+                    if attempt:
+                        raise PhpWorkerError(f"PHP worker failed twice: {e}") from e
+                    self.restarts += 1
+        if 'error' in response:
+            raise PhpWorkerError(response['error'])
+        return response['results']
+
+    def _start(self):
+        """Launch php reading requests from stdin"""
+        self.process = subprocess.Popen(
+            # Warnings and notices must never end up on the response channel
+            [self.php, '-d', 'display_errors=stderr', '-d', 'error_reporting=0', '-r', self.SCRIPT],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding='utf-8', bufsize=1
+        )
+
+    def _exchange(self, line):
+        """Write one request line and read its response line"""
+        self.process.stdin.write(line)
+        self.process.stdin.flush()
+        readable, _, _ = select.select([self.process.stdout], [], [], self.timeout)
+        if not readable:
+            raise PhpWorkerError(f"no response within {self.timeout} s")
+        response = self.process.stdout.readline()
+        if not response:
+            raise PhpWorkerError(f"php exited with code {self.process.wait()}")
+        return json.loads(response)
+
+    def _stop(self):
+        """Kill the php process, if any"""
+        if self.process is None:
+            return
+        process, self.process = self.process, None
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        try:
+            process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        for pipe in (process.stdout, process.stderr):
+            if pipe is not None:
+                pipe.close()
+
 
 class DatabaseHelper:
     """Helper class for database operations"""
@@ -13,61 +225,85 @@ class DatabaseHelper:
     @staticmethod
     def hash_password_php(password):
         """
-        Hash password using PHP password_hash function
-        Compatible with PHP bcrypt hashing
+        Hash password compatible with PHP password_hash function
+        Uses the in-process PasswordHasher instead of spawning PHP
         """
-        try:
-            result = subprocess.run(
-                ['php', '-r', f"echo password_hash('{password}', PASSWORD_DEFAULT);"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.stdout.strip() if result.stdout else None
-        except Exception as e:
-            print(f"Error hashing password with PHP: {e}")
-            return None
+        return PasswordHasher.hash(password)
+    
+    @staticmethod
+    def hash_passwords_php(passwords, cost=None):
+        """Hash passwords with PHP password_hash itself, in one round trip"""
+        return PhpWorker.shared().hash(passwords, cost)
     
     @staticmethod
     def verify_password_php(password, hash_value):
         """
         Verify password against PHP bcrypt hash
         """
+        return DatabaseHelper.verify_passwords_php([(password, hash_value)])[0]
+    
+    @staticmethod
+    def verify_passwords_php(pairs):
+        """password_verify every (password, hash) pair in one round trip"""
+        pairs = list(pairs)
         try:
-            php_code = f"""
-            <?php
-            $password = '{password}';
-            $hash = '{hash_value}';
-            echo (password_verify($password, $hash)) ? 'true' : 'false';
-            ?>
-            """
-            result = subprocess.run(
-                ['php', '-r', php_code.replace('<?php ', '').replace(' ?>', '')],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.stdout.strip() == 'true'
-        except Exception as e:
+            return PhpWorker.shared().verify(pairs)
+        except PhpWorkerError as e:
             print(f"Error verifying password: {e}")
-            return False
+            return [False] * len(pairs)
 
 
 class TestDataGenerator:
-    """Generate test data"""
-    
+    """
+    Generate test data
+
+    Every username and email is namespaced by the pytest-xdist worker id
+    and a process-wide monotonic counter, so parallel workers never touch
+    each other's users.
+    """
+
+    __test__ = False  # not a test class, despite the name
+
+    _counter = itertools.count(1)
+
     @staticmethod
-    def generate_username():
+    def worker_id():
+        """Return the xdist worker id ('gw0', 'gw1', ...) or 'main'"""
+        return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+    @staticmethod
+    def namespace():
+        """Prefix shared by all data generated in this worker"""
+        return f"t{TestDataGenerator.worker_id()}"
+
+    @staticmethod
+    def namespace_like_pattern():
+        """SQL LIKE pattern matching every username of this worker"""
+        escaped = TestDataGenerator.namespace().replace("_", "\\_").replace("%", "\\%")
+        return f"{escaped}\\_%"
+
+    @staticmethod
+    def generate_username(base="testuser"):
         """Generate unique username"""
-        timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
-        return f"testuser_{timestamp}"
+        return f"{TestDataGenerator.namespace()}_{base}_{next(TestDataGenerator._counter)}"
     
     @staticmethod
-    def generate_email():
+    def generate_email(base="test"):
         """Generate unique email"""
-        timestamp = datetime.now().strftime('%Y%m%d%H%M%S%f')
-        return f"test_{timestamp}@example.com"
+        return f"{TestDataGenerator.namespace()}_{base}_{next(TestDataGenerator._counter)}@example.com"
     
+    @staticmethod
+    def generate_users(count, base="seed", passwords=("Seed@123",), name="Seed User"):
+        """Lazily yield count user records, cycling through passwords"""
+        password_cycle = itertools.cycle(passwords)
+        for _ in range(count):
+            yield {
+                'username': TestDataGenerator.generate_username(base),
+                'name': name,
+                'email': TestDataGenerator.generate_email(base),
+                'password': next(password_cycle),
+            }
+
     @staticmethod
     def get_valid_register_data():
         """Get valid registration test data"""
@@ -92,7 +328,7 @@ class TestDataGenerator:
             'password_mismatch': {**base_data, 'repassword': 'Different@123'},
             'invalid_email': {**base_data, 'email': 'invalid-email'},
             'long_password': {**base_data, 'password': 'A' * 100, 'repassword': 'A' * 100},
-            'special_username': {**base_data, 'username': 'user@test#123'}
+            'special_username': {**base_data, 'username': TestDataGenerator.generate_username('user@test#')}
         }
 
 
@@ -100,17 +336,17 @@ class SeleniumHelper:
     """Helper functions for Selenium tests"""
     
     @staticmethod
-    def wait_for_redirect(driver, expected_url, timeout=5):
+    def wait_for_redirect(driver, expected_url, timeout=5, poll=0.05):
         """Wait for redirect to specific URL"""
-        import time
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
-            if expected_url in driver.current_url:
-                return True
-            time.sleep(0.5)
-        
-        return False
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=poll).until(EC.url_contains(expected_url))
+            return True
+        except TimeoutException:
+            return False
     
     @staticmethod
     def clear_all_cookies(driver):
@@ -152,6 +388,63 @@ class ReportHelper:
             json.dump(report_data, f, indent=2)
         print(f"Report saved: {filename}")
     
+    @staticmethod
+    def load_phase_timing(filename):
+        """Build a test summary from a --phase-timing-json file"""
+        with open(filename) as f:
+            timing = json.load(f)
+        summary = ReportHelper.generate_test_summary(timing['tests'])
+        summary['fixtures'] = timing['fixtures']
+        summary['total_duration'] = sum(t.get('duration', 0.0) for t in timing['tests'])
+        return summary
+    
+    @staticmethod
+    def merge_phase_timing(filenames, output):
+        """Combine the --phase-timing-json files of several shards into output"""
+        tests = []
+        fixtures = {}
+        for filename in filenames:
+            with open(filename) as f:
+                timing = json.load(f)
+            tests.extend(timing.get('tests', []))
+            for entry in timing.get('fixtures', []):
+                total = fixtures.setdefault(entry['name'], {
+                    'setup': 0.0, 'teardown': 0.0, 'setup_count': 0, 'teardown_count': 0
+                })
+                for key in total:
+                    total[key] += entry.get(key, 0)
+        merged = {
+            'tests': sorted(tests, key=lambda test: test['name']),
+            'fixtures': [dict(entry, name=name) for name, entry in sorted(fixtures.items())],
+        }
+        with open(output, 'w') as f:
+            json.dump(merged, f, indent=2)
+        return merged
+
+    @staticmethod
+    def merge_junit(filenames, output):
+        """Combine the JUnit XML files of several shards into one testsuite"""
+        merged = ET.Element('testsuite', name='pytest')
+        totals = {'tests': 0, 'errors': 0, 'failures': 0, 'skipped': 0}
+        seconds = 0.0
+        for filename in filenames:
+            root = ET.parse(filename).getroot()
+            suites = [root] if root.tag == 'testsuite' else root.findall('testsuite')
+            for suite in suites:
+                for key in totals:
+                    totals[key] += int(suite.get(key, 0))
+                seconds += float(suite.get('time', 0))
+                merged.extend(suite.findall('testcase'))
+        for key, value in totals.items():
+            merged.set(key, str(value))
+        merged.set('time', f"{seconds:.3f}")
+
+        root = ET.Element('testsuites')
+        root.append(merged)
+        ET.indent(root)
+        ET.ElementTree(root).write(output, encoding='utf-8', xml_declaration=True)
+        return totals
+
     @staticmethod
     def print_test_summary(summary):
         """Print test summary to console"""
@@ -0,0 +1,407 @@
+"""
+Test Suite for the Test Infrastructure
+Checks the plugins and fixtures the other suites rely on, without the app or a browser
+"""
+import threading
+from functools import partial
+
+import pytest
+from mysql.connector import Error
+from selenium.common.exceptions import TimeoutException
+
+from db_isolation import DbIsolation
+from db_pool import ConnectionPool
+from pages.http_backend import HttpLoginPage
+from plugins.shard import assign_shards
+from sqlite_backend import SqliteConnection, translate
+from user_seeder import INSERT_PREFIX, INSERT_SUFFIX
+
+NAMESPACE_PATTERN = "tinfra\\_%"
+
+
+class FakeMark:
+    """Marker with args, as returned by get_closest_marker"""
+
+    def __init__(self, *args):
+        """Initialize marker"""
+        self.args = args
+        self.kwargs = {}
+
+
+class FakeItem:
+    """Collected test with a nodeid and markers"""
+
+    def __init__(self, nodeid, **markers):
+        """Initialize item; markers maps name -> marker args"""
+        self.nodeid = nodeid
+        self.markers = markers
+
+    def get_closest_marker(self, name):
+        """Marker name of this item, or None"""
+        if name not in self.markers:
+            return None
+        return FakeMark(*self.markers[name])
+
+
+@pytest.mark.infrastructure
+class TestShardPlugin:
+    """Test Cases for the greedy duration balanced sharding"""
+
+    # ==================== INFRA_001: Shard Partition ====================
+
+    def test_infra_001_assign_shards_partition(self):
+        """
+        INFRA_001: Verifikasi pembagian test ke shard
+
+        Steps:
+        1. Bagi 20 test dengan durasi berbeda dan satu xdist_group ke 3 shard
+        2. Ulangi dengan urutan test terbalik
+
+        Expected Result:
+        - Setiap test masuk tepat ke satu shard
+        - Test satu xdist_group berada di shard yang sama
+        - Selisih beban shard tidak lebih dari unit terbesar
+        - Input yang sama selalu menghasilkan pembagian yang sama
+        """
+        items = [FakeItem(f"tests/test_x.py::test_{i:02d}") for i in range(20)]
+        items += [FakeItem(f"tests/test_y.py::test_grouped_{i}", xdist_group=("pool",)) for i in range(3)]
+        durations = {item.nodeid: float(1 + i % 7) for i, item in enumerate(items)}
+
+        assignment, loads = assign_shards(items, 3, durations)
+
+        assert sorted(assignment) == sorted(item.nodeid for item in items)
+        assert set(assignment.values()) == {1, 2, 3}
+        assert len({assignment[item.nodeid] for item in items if "grouped" in item.nodeid}) == 1
+        largest_unit = sum(durations[item.nodeid] for item in items if "grouped" in item.nodeid)
+        assert max(loads) - min(loads) <= largest_unit
+        assert sum(loads) == pytest.approx(sum(durations.values()))
+
+        assert assign_shards(items, 3, durations) == (assignment, loads)
+        assert assign_shards(list(reversed(items)), 3, durations)[0] == assignment
+
+
+def _add_user(connection, username):
+    """Insert a user directly, like the PHP app would; returns its id"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            "INSERT INTO users (username, name, email, password) VALUES (%s, %s, %s, %s)",
+            (username, "Infra User", f"{username}@example.com", "x")
+        )
+        return cursor.lastrowid
+    finally:
+        cursor.close()
+
+
+def _usernames(connection):
+    """Every username in the users table"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT username FROM users ORDER BY id")
+        return [row[0] for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+
+@pytest.fixture
+def sqlite_connection(tmp_path):
+    """Connection to a private SQLite users table"""
+    connection = SqliteConnection(str(tmp_path / "users.sqlite"))
+    yield connection
+    connection.close()
+
+
+@pytest.mark.infrastructure
+class TestDbIsolation:
+    """Test Cases for the batched cleanup of DbIsolation"""
+
+    # ==================== INFRA_002: Track Mode Cleanup ====================
+
+    def test_infra_002_track_cleanup_keeps_seeded_rows(self, sqlite_connection):
+        """
+        INFRA_002: Verifikasi DELETE batch menghapus baris test dan menyisakan baris seed
+
+        Steps:
+        1. Isi satu user di luar namespace dan satu sisa run sebelumnya, lalu mulai sesi
+        2. Dalam mode track: insert user lewat fixture, insert user seperti app,
+           seed user dengan keep_rows_added_since, dan insert user di luar namespace
+        3. Jalankan finish(app_touched=True)
+
+        Expected Result:
+        - Sisa run sebelumnya dihapus saat sesi dimulai
+        - User yang di-track dan user namespace di atas high-water mark dihapus
+        - User seed dan user di luar namespace tetap ada
+        """
+        _add_user(sqlite_connection, "existing")
+        _add_user(sqlite_connection, "tinfra_leftover")
+        isolation = DbIsolation(sqlite_connection, NAMESPACE_PATTERN)
+        isolation.start_session()
+        assert _usernames(sqlite_connection) == ["existing"]
+
+        isolation.begin(DbIsolation.TRACK)
+        assert isolation.insert_user("tinfra_tracked", "Infra User", "tracked@example.com", "x")
+        _add_user(sqlite_connection, "tinfra_app")
+        mark = isolation.max_user_id()
+        _add_user(sqlite_connection, "tinfra_seed_1")
+        _add_user(sqlite_connection, "tinfra_seed_2")
+        isolation.keep_rows_added_since(mark)
+        _add_user(sqlite_connection, "tinfra_after_seed")
+        _add_user(sqlite_connection, "outsider")
+        isolation.finish(app_touched=True)
+
+        assert _usernames(sqlite_connection) == ["existing", "tinfra_seed_1", "tinfra_seed_2", "outsider"]
+
+    # ==================== INFRA_003: Rollback Mode Cleanup ====================
+
+    def test_infra_003_rollback_cleanup(self, sqlite_connection):
+        """
+        INFRA_003: Verifikasi mode rollback membatalkan insert fixture
+
+        Steps:
+        1. Mulai sesi dan test dalam mode rollback
+        2. Insert user lewat fixture
+        3. Jalankan finish(app_touched=False)
+
+        Expected Result:
+        - User terlihat selama test berjalan
+        - Setelah finish tidak ada user tersisa
+        """
+        isolation = DbIsolation(sqlite_connection, NAMESPACE_PATTERN)
+        isolation.start_session()
+
+        isolation.begin(DbIsolation.ROLLBACK)
+        isolation.insert_user("tinfra_rolled_back", "Infra User", "rolled@example.com", "x")
+        assert _usernames(sqlite_connection) == ["tinfra_rolled_back"]
+        isolation.finish(app_touched=False)
+
+        assert _usernames(sqlite_connection) == []
+
+
+class DroppingSqliteConnection(SqliteConnection):
+    """SQLite connection whose link can be made to drop, like a MySQL timeout"""
+
+    dropped = False
+
+    def is_connected(self):
+        """False once dropped"""
+        return not self.dropped
+
+    def ping(self, reconnect=False, attempts=1, delay=0):
+        """A dropped link cannot be revived"""
+        if self.dropped:
+            raise Error(msg="Lost connection")
+
+
+@pytest.mark.infrastructure
+class TestConnectionPool:
+    """Test Cases for ConnectionPool checkout, validation and stats"""
+
+    # ==================== INFRA_004: Exhausted Pool ====================
+
+    def test_infra_004_exhausted_pool_times_out(self, tmp_path):
+        """
+        INFRA_004: Verifikasi pool yang habis menunggu lalu gagal dengan jelas
+
+        Steps:
+        1. Buat pool berukuran 1 dan pinjam satu-satunya koneksi
+        2. Pinjam lagi dengan timeout singkat
+        3. Pinjam lagi sementara thread lain mengembalikan koneksi setelah 50 ms
+
+        Expected Result:
+        - Peminjaman kedua gagal dengan TimeoutError yang menyebut ukuran pool
+        - Peminjaman ketiga mendapat koneksi yang sama setelah menunggu
+        - Statistik mencatat checkout, waktu tunggu, dan rata-ratanya
+        """
+        pool = ConnectionPool(partial(SqliteConnection, str(tmp_path / "pool.sqlite")), size=1)
+        try:
+            connection = pool.acquire()
+            with pytest.raises(TimeoutError, match="all 1 are checked out"):
+                pool.acquire(timeout=0.05)
+
+            releaser = threading.Timer(0.05, pool.release, (connection,))
+            releaser.start()
+            assert pool.acquire(timeout=5) is connection
+            releaser.join()
+
+            stats = pool.stats()
+            assert stats['checkouts'] == 2
+            assert stats['created'] == 1
+            assert stats['waits'] == 1
+            assert stats['in_use'] == 1
+            assert stats['mean_wait_ms'] >= 40
+            assert stats['mean_wait_ms'] == pytest.approx(stats['wait_s'] * 1000)
+            assert f"{stats['mean_wait_ms']:.1f} ms mean" in pool.format_stats()
+        finally:
+            pool.close()
+
+    # ==================== INFRA_005: Stale Connection ====================
+
+    def test_infra_005_stale_connection_replaced(self, tmp_path):
+        """
+        INFRA_005: Verifikasi koneksi idle yang putus diganti koneksi baru
+
+        Steps:
+        1. Buat pool yang memvalidasi setiap koneksi idle (validate_after=0)
+        2. Pinjam, putuskan, lalu kembalikan koneksi
+        3. Pinjam lagi
+
+        Expected Result:
+        - Koneksi yang putus dibuang dan koneksi baru dibuat
+        - Statistik mencatat satu koneksi dibuang
+        """
+        pool = ConnectionPool(
+            partial(DroppingSqliteConnection, str(tmp_path / "pool.sqlite")), size=1, validate_after=0
+        )
+        try:
+            stale = pool.acquire()
+            stale.dropped = True
+            pool.release(stale)
+
+            fresh = pool.acquire(timeout=1)
+            assert fresh is not stale
+            assert not fresh.dropped
+            stats = pool.stats()
+            assert stats['created'] == 2
+            assert stats['discarded'] == 1
+            pool.release(fresh)
+        finally:
+            pool.close()
+
+
+@pytest.mark.infrastructure
+class TestSqliteBackend:
+    """Test Cases for the MySQL to SQLite rewrite of the SQLite stand-in"""
+
+    # ==================== INFRA_006: Statement Translation ====================
+
+    def test_infra_006_translate_fixture_statements(self):
+        """
+        INFRA_006: Verifikasi SQL MySQL dari fixture diterjemahkan ke SQLite
+
+        Steps:
+        1. Terjemahkan upsert DbIsolation.insert_user, insert batch UserSeeder,
+           DELETE cleanup dengan LIKE, dan SELECT biasa
+
+        Expected Result:
+        - Placeholder %s menjadi ?
+        - LIKE mendapat ESCAPE '\\' seperti default MySQL
+        - ON DUPLICATE KEY UPDATE menjadi ON CONFLICT DO UPDATE SET dengan excluded.*,
+          tanpa id = LAST_INSERT_ID(id)
+        - INSERT mendapat RETURNING id; statement lain tidak berubah
+        """
+        assert translate(
+            "INSERT INTO users (username, name, email, password) "
+            "VALUES (%s, %s, %s, %s) "
+            "ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id), name = VALUES(name), "
+            "email = VALUES(email), password = VALUES(password)"
+        ) == (
+            "INSERT INTO users (username, name, email, password) "
+            "VALUES (?, ?, ?, ?) "
+            "ON CONFLICT DO UPDATE SET name = excluded.name, "
+            "email = excluded.email, password = excluded.password RETURNING id"
+        )
+        assert translate(INSERT_PREFIX + "(%s, %s, %s, %s), (%s, %s, %s, %s)" + INSERT_SUFFIX) == (
+            "INSERT INTO users (username, name, email, password) VALUES (?, ?, ?, ?), (?, ?, ?, ?) "
+            "ON CONFLICT DO UPDATE SET name = excluded.name, email = excluded.email, "
+            "password = excluded.password RETURNING id"
+        )
+        assert translate(
+            "DELETE FROM users WHERE id > %s AND (username LIKE %s OR id IN (%s, %s))"
+        ) == "DELETE FROM users WHERE id > ? AND (username LIKE ? ESCAPE '\\' OR id IN (?, ?))"
+        assert translate("SELECT COALESCE(MAX(id), 0) FROM users") == "SELECT COALESCE(MAX(id), 0) FROM users"
+
+    # ==================== INFRA_007: Translated Semantics ====================
+
+    def test_infra_007_upsert_and_like_behave_like_mysql(self, sqlite_connection):
+        """
+        INFRA_007: Verifikasi hasil SQL terjemahan sama dengan perilaku MySQL
+
+        Steps:
+        1. Upsert user yang sama dua kali lewat SqliteConnection
+        2. Hapus dengan pola LIKE yang meng-escape underscore
+
+        Expected Result:
+        - Upsert kedua memperbarui baris dan mengembalikan id yang sama
+        - Underscore yang di-escape hanya cocok dengan underscore literal
+        """
+        upsert = (
+            "INSERT INTO users (username, name, email, password) VALUES (%s, %s, %s, %s) "
+            "ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id), name = VALUES(name), "
+            "email = VALUES(email), password = VALUES(password)"
+        )
+        cursor = sqlite_connection.cursor()
+        try:
+            cursor.execute(upsert, ("tinfra_upsert", "First", "upsert@example.com", "x"))
+            first_id = cursor.lastrowid
+            cursor.execute(upsert, ("tinfra_upsert", "Second", "upsert@example.com", "y"))
+            assert cursor.lastrowid == first_id
+            cursor.execute("SELECT name, password FROM users WHERE id = %s", (first_id,))
+            assert cursor.fetchone() == ("Second", "y")
+        finally:
+            cursor.close()
+
+        _add_user(sqlite_connection, "tinfraXother")
+        cursor = sqlite_connection.cursor()
+        try:
+            cursor.execute("DELETE FROM users WHERE username LIKE %s", (NAMESPACE_PATTERN,))
+            assert cursor.rowcount == 1
+        finally:
+            cursor.close()
+        assert _usernames(sqlite_connection) == ["tinfraXother"]
+
+
+class FakeResponse:
+    """Final requests response of a form POST"""
+
+    def __init__(self, url, text):
+        """Initialize response"""
+        self.url = url
+        self.text = text
+        self.content = text.encode("utf-8")
+
+
+class FakeSession:
+    """requests session answering every POST with one response"""
+
+    def __init__(self, response):
+        """Initialize session"""
+        self.response = response
+
+    def post(self, url, data=None, timeout=None):
+        """Return the canned response"""
+        return self.response
+
+
+@pytest.mark.infrastructure
+class TestHttpBackend:
+    """Test Cases for the outcome reported by the HTTP page objects"""
+
+    # ==================== INFRA_008: Submit Outcome ====================
+
+    def test_infra_008_http_submit_reports_outcome(self):
+        """
+        INFRA_008: Verifikasi submit_and_wait_for HTTP melaporkan hasil seperti Selenium
+
+        Steps:
+        1. Submit form yang dijawab redirect ke index.php
+        2. Submit form yang dijawab alert error di login.php
+        3. Minta hasil yang tidak tercapai
+
+        Expected Result:
+        - Redirect menghasilkan "url", alert menghasilkan "error"
+        - Tanpa url/error hasilnya "loaded"
+        - Hasil yang tidak tercapai menghasilkan TimeoutException
+        """
+        redirected = FakeResponse("http://localhost/quiz/index.php", "<p>Welcome</p>")
+        rejected = FakeResponse(
+            "http://localhost/quiz/login.php",
+            '<div class="alert alert-danger" role="alert">Register User Gagal !!</div>'
+        )
+
+        assert HttpLoginPage(FakeSession(redirected)).submit_and_wait_for(url="index.php", error=True) == "url"
+        assert HttpLoginPage(FakeSession(rejected)).submit_and_wait_for(url="index.php", error=True) == "error"
+        assert HttpLoginPage(FakeSession(rejected)).submit_and_wait_for() == "loaded"
+        with pytest.raises(TimeoutException):
+            HttpLoginPage(FakeSession(rejected)).submit_and_wait_for(url="index.php")
+        with pytest.raises(TimeoutException):
+            HttpLoginPage(FakeSession(redirected)).submit_and_wait_for(error=True)
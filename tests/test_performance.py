@@ -0,0 +1,215 @@
+"""
+Test Suite for Performance of the Auth Endpoints
+Load tests against login.php and register.php
+"""
+import pytest
+
+from perf.load import check_slos, format_summary, run_closed_loop
+from perf.open_loop import OpenLoopGenerator, find_knee, format_curve, linear_ramp
+from perf.table_scaling import format_scaling, run_scaling, username_index_problems
+from pages.login_page import LoginPage
+from pages.navigation_timing import parse_budgets
+from pages.register_page import RegisterPage
+
+
+def _arrival_rates(option):
+    """Parse --arrival-rates: '5,10,20' or a 'start:stop:steps' ramp"""
+    if ":" in option:
+        start, stop, steps = option.split(":")
+        return linear_ramp(float(start), float(stop), int(steps))
+    return [float(rate) for rate in option.split(",") if rate.strip()]
+
+
+class TestAuthPerformance:
+    """Performance Test Cases for login.php and register.php"""
+
+    # ==================== PERF_001: Closed-Loop Register -> Login ====================
+
+    @pytest.mark.performance
+    def test_perf_001_closed_loop_register_login(self, request, app_url):
+        """
+        PERF_001: Register -> login flow under concurrent closed-loop load
+        
+        Steps:
+        1. Start --load-users virtual users
+        2. Each user registers a new account, then logs in with it,
+           --load-iterations times
+        
+        Expected Result:
+        - p95/p99 latency per endpoint within --slo-p95-ms/--slo-p99-ms
+        - Error rate per endpoint within --slo-max-error-rate
+        """
+        config = request.config
+        stats = run_closed_loop(
+            app_url,
+            users=config.getoption("load_users"),
+            iterations=config.getoption("load_iterations")
+        )
+        summary = stats.summary()
+        print("\n" + format_summary(summary, stats.duration))
+        request.node.user_properties.append(("load_summary", summary))
+        
+        assert summary, "No requests were recorded"
+        violations = check_slos(
+            summary,
+            p95_ms=config.getoption("slo_p95_ms"),
+            p99_ms=config.getoption("slo_p99_ms"),
+            max_error_rate=config.getoption("slo_max_error_rate")
+        )
+        assert not violations, "SLO breached:\n" + "\n".join(violations)
+
+    # ==================== PERF_002: Open-Loop Arrival Rate Sweep ====================
+
+    @pytest.mark.performance
+    @pytest.mark.timeout(300)
+    def test_perf_002_open_loop_rate_vs_latency(self, request, app_url, insert_test_user, test_data):
+        """
+        PERF_002: Latency of login.php/register.php vs offered arrival rate
+        
+        Steps:
+        1. Insert a user to log in with
+        2. For each rate in --arrival-rates, issue a 50/50 mix of login and
+           register requests at that rate for --step-duration seconds,
+           regardless of how fast the app answers
+        3. Find the knee of the rate-vs-p95-latency curve
+        
+        Expected Result:
+        - Every step produced measurements
+        - The knee is not below --slo-min-knee-rps
+        """
+        config = request.config
+        username = test_data.generate_username('openloop')
+        insert_test_user(username, test_data.generate_email('openloop'), 'Test@123')
+        
+        generator = OpenLoopGenerator(app_url, username, 'Test@123')
+        curve = generator.run(
+            _arrival_rates(config.getoption("arrival_rates")),
+            config.getoption("step_duration")
+        )
+        knee = find_knee(curve)
+        print("\n" + format_curve(curve, knee))
+        request.node.user_properties.append(("rate_latency_curve", curve))
+        request.node.user_properties.append(("knee_rps", knee))
+        
+        assert all(point["offered"] for point in curve), "Every step should issue requests"
+        min_knee = config.getoption("slo_min_knee_rps")
+        if knee is not None and min_knee:
+            assert knee >= min_knee, f"Latency knee at {knee:.1f} req/s, below {min_knee} req/s"
+
+    # ==================== PERF_003: Bulk User Seeding ====================
+
+    @pytest.mark.performance
+    def test_perf_003_bulk_seed_users(self, request, seed_users, db_pool, test_data):
+        """
+        PERF_003: Bulk seeding throughput of the users table
+        
+        Steps:
+        1. Stream --seed-users generated users into the users table with
+           batched multi-row inserts
+        2. Count the seeded rows
+        
+        Expected Result:
+        - Every generated user is in the users table
+        - Throughput (rows/s) is reported
+        """
+        count = request.config.getoption("seed_users")
+        report = seed_users(count, base='bulk')
+        request.node.user_properties.append(("seed_rows_per_sec", report.rows_per_sec))
+        request.node.user_properties.append(("db_pool", db_pool.stats()))
+        
+        with db_pool.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT COUNT(*) FROM users WHERE username LIKE %s",
+                (f"{test_data.namespace()}\\_bulk\\_%",)
+            )
+            seeded = cursor.fetchone()[0]
+            cursor.close()
+        
+        assert report.rows == count, f"Seeder reported {report.rows} rows, expected {count}"
+        assert seeded == count, f"Found {seeded} seeded users, expected {count}"
+
+    # ==================== PERF_004: users Table Scaling ====================
+
+    @pytest.mark.performance
+    @pytest.mark.timeout(600)
+    def test_perf_004_users_table_scaling(self, request, app_url, db_pool, seed_users,
+                                          insert_test_user, test_data):
+        """
+        PERF_004: Login/register lookup path as the users table grows
+        
+        Steps:
+        1. Insert a user to log in with
+        2. For each size in --table-sizes, bulk seed the users table up to
+           that many rows
+        3. At each size, EXPLAIN the username lookup and time it in MySQL,
+           through login.php and through register.php
+        
+        Expected Result:
+        - users.username is indexed
+        - The lookup never scans the whole table or index
+        """
+        config = request.config
+        if config.getoption("db_backend") == "sqlite":
+            pytest.skip("SHOW INDEX and EXPLAIN need MySQL")
+        username = test_data.generate_username('scaling')
+        insert_test_user(username, test_data.generate_email('scaling'), 'Test@123')
+        
+        sizes = [int(size) for size in config.getoption("table_sizes").split(",") if size.strip()]
+        results = run_scaling(
+            db_pool,
+            lambda count: seed_users(count, base='scale', cost=4),
+            app_url,
+            username,
+            'Test@123',
+            sizes,
+            iterations=config.getoption("bench_iterations"),
+            warmup=config.getoption("bench_warmup")
+        )
+        print("\n" + format_scaling(results))
+        request.node.user_properties.append(("db_pool", db_pool.stats()))
+        request.node.user_properties.append(("table_scaling", [
+            {key: value for key, value in result.items() if key != 'plan'} for result in results
+        ]))
+        
+        with db_pool.connection() as conn:
+            problems = username_index_problems(conn)
+        problems += [f"{result['rows']} rows: {problem}" for result in results for problem in result['problems']]
+        assert not problems, "Lookup path does not scale:\n" + "\n".join(problems)
+
+    # ==================== PERF_005: Page Load Budgets ====================
+
+    @pytest.mark.performance
+    def test_perf_005_page_load_budgets(self, request, driver, app_url, navigation_timings):
+        """
+        PERF_005: Navigation Timing of login.php and register.php within budget
+        
+        Steps:
+        1. Load login.php and register.php --bench-iterations times each
+        2. Read TTFB, DOMContentLoaded, load, bytes and request count of
+           every load from the Navigation and Resource Timing APIs
+        
+        Expected Result:
+        - Every --page-budgets entry (e.g. login.php:ttfb_ms:p95<50) holds
+        """
+        config = request.config
+        budgets = parse_budgets(config.getoption("page_budgets"))
+        login_page = LoginPage(driver)
+        register_page = RegisterPage(driver)
+        for _ in range(config.getoption("bench_iterations")):
+            login_page.navigate_to(app_url)
+            register_page.navigate_to(app_url)
+        
+        summary = navigation_timings.summary()
+        request.node.user_properties.append(("navigation_summary", summary))
+        for page, row in summary.items():
+            print(f"\n{page}: ttfb p95 {row['ttfb_ms_p95']:.1f} ms, load p95 "
+                  f"{row['load_ms_p95'] or 0:.1f} ms, {row['bytes_p50']:.0f} bytes, "
+                  f"{row['requests_p50']:.0f} requests (n={row['count']})")
+        
+        assert {'login.php', 'register.php'} <= set(summary), "No navigations were recorded"
+        violations = [
+            violation for page, metric, pct, limit in budgets
+            if (violation := navigation_timings.check_budget(page, metric, limit, pct))
+        ]
+        assert not violations, "Page load budget exceeded:\n" + "\n".join(violations)
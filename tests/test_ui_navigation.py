@@ -6,7 +6,6 @@ import pytest
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-import time
 
 from pages.login_page import LoginPage
 from pages.register_page import RegisterPage
@@ -44,7 +43,6 @@ class TestNavigationAndUI:
         
         # Action: Click login link
         register_page.click_login_link()
-        time.sleep(1)
         
         # Expected: Redirect to login page
         assert "login.php" in driver.current_url, "Should redirect to login.php"
@@ -82,7 +80,6 @@ class TestNavigationAndUI:
         
         # Action: Click register link
         login_page.click_register_link()
-        time.sleep(1)
         
         # Expected: Redirect to register page
         assert "register.php" in driver.current_url, "Should redirect to register.php"
@@ -124,7 +121,6 @@ class TestNavigationAndUI:
         
         # Action: Click login link
         register_page.click_login_link()
-        time.sleep(1)
         
         # Expected: Redirect to login page
         assert "login.php" in driver.current_url, "Should redirect to login.php"
@@ -138,7 +134,8 @@ class TestNavigationAndUI:
     @pytest.mark.ui
     @pytest.mark.smoke
     @pytest.mark.stub
-    def test_ft_021_logout_and_protected_pages(self, driver, insert_test_user):
+    @pytest.mark.xdist_group("test_user_hash")
+    def test_ft_021_logout_and_protected_pages(self, driver, insert_test_user, test_data):
         """
         FT_021: Verifikasi proses Logout dan proteksi halaman
         
@@ -162,14 +159,14 @@ class TestNavigationAndUI:
         - Halaman proteksi bekerja dengan baik
         """
         # Setup: Insert test user
-        insert_test_user('testuser', 'test@example.com', 'Test@123')
+        username = test_data.generate_username('testuser')
+        insert_test_user(username, test_data.generate_email(), 'Test@123')
         
         login_page = LoginPage(driver)
         login_page.navigate_to()
         
         # Action: Login
-        login_page.login('testuser', 'Test@123')
-        time.sleep(2)
+        login_page.login(username, 'Test@123')
         
         # At this point, should redirect to index.php
         current_url = driver.current_url
@@ -198,11 +195,9 @@ class TestNavigationAndUI:
         assert login_page.is_page_title_correct()
         
         login_page.click_register_link()
-        time.sleep(1)
         assert register_page.is_page_title_correct()
         
         register_page.click_login_link()
-        time.sleep(1)
         assert login_page.is_page_title_correct()
         
         # Test 2: Register -> Login -> Register cycle
@@ -210,11 +205,9 @@ class TestNavigationAndUI:
         assert register_page.is_page_title_correct()
         
         register_page.click_login_link()
-        time.sleep(1)
         assert login_page.is_page_title_correct()
         
         login_page.click_register_link()
-        time.sleep(1)
         assert register_page.is_page_title_correct()
 
     @pytest.mark.ui